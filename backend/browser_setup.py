@@ -8,7 +8,6 @@ Sets up headless Chrome for web scraping legal documents
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-import requests
 import logging
 from typing import Optional, Dict, Any
 import asyncio
@@ -41,8 +40,16 @@ def create_legal_browser():
         logger.warning(f"ChromeDriver not available: {e}")
         return None
 
-async def fetch_with_requests(url: str, headers: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
-    """Fallback method using requests for API sources"""
+async def fetch_with_requests(
+    url: str,
+    headers: Optional[Dict] = None,
+    session: Optional[aiohttp.ClientSession] = None
+) -> Optional[Dict[str, Any]]:
+    """Fallback method using requests for API sources
+    
+    Pass a long-lived ``session`` to reuse its pooled connections; otherwise a
+    one-off session is opened for this request.
+    """
     if headers is None:
         headers = {
             'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -53,30 +60,10 @@ async def fetch_with_requests(url: str, headers: Optional[Dict] = None) -> Optio
         }
     
     try:
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    content_type = response.headers.get('content-type', '')
-                    
-                    if 'json' in content_type:
-                        data = await response.json()
-                    else:
-                        data = await response.text()
-                    
-                    return {
-                        'url': url,
-                        'status': 'success',
-                        'content': data,
-                        'content_type': content_type,
-                        'status_code': response.status
-                    }
-                else:
-                    return {
-                        'url': url,
-                        'status': 'error',
-                        'error': f'HTTP {response.status}',
-                        'status_code': response.status
-                    }
+        if session is None:
+            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as one_off_session:
+                return await _fetch_response(one_off_session, url, headers)
+        return await _fetch_response(session, url, headers)
     
     except Exception as e:
         return {
@@ -85,6 +72,32 @@ async def fetch_with_requests(url: str, headers: Optional[Dict] = None) -> Optio
             'error': str(e)
         }
 
+async def _fetch_response(session: aiohttp.ClientSession, url: str, headers: Dict) -> Dict[str, Any]:
+    """Issue the GET for fetch_with_requests and shape the result"""
+    async with session.get(url, headers=headers) as response:
+        if response.status == 200:
+            content_type = response.headers.get('content-type', '')
+            
+            if 'json' in content_type:
+                data = await response.json()
+            else:
+                data = await response.text()
+            
+            return {
+                'url': url,
+                'status': 'success',
+                'content': data,
+                'content_type': content_type,
+                'status_code': response.status
+            }
+        else:
+            return {
+                'url': url,
+                'status': 'error',
+                'error': f'HTTP {response.status}',
+                'status_code': response.status
+            }
+
 class DocumentExtractor:
     """Extract documents from legal sources without full browser"""
     
@@ -92,7 +105,14 @@ class DocumentExtractor:
         self.session = None
         
     async def __aenter__(self):
+        # One pooled session for every fetch made through this extractor
         self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=30
+            ),
             timeout=aiohttp.ClientTimeout(total=60),
             headers={
                 'User-Agent': 'Legal Research Bot 1.0 (Educational/Research Purpose)',
@@ -118,7 +138,7 @@ class DocumentExtractor:
                 full_url = f"{base_url.rstrip('/')}/{endpoint_path.lstrip('/')}"
                 
                 try:
-                    result = await fetch_with_requests(full_url)
+                    result = await fetch_with_requests(full_url, session=self.session)
                     if result and result['status'] == 'success':
                         # Process the API response
                         content = result['content']
@@ -159,7 +179,7 @@ class DocumentExtractor:
             base_url = source_config.base_url
             
             # Fetch main page
-            result = await fetch_with_requests(base_url)
+            result = await fetch_with_requests(base_url, session=self.session)
             
             if result and result['status'] == 'success':
                 content = result['content']
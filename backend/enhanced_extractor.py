@@ -22,6 +22,13 @@ import urllib3
 from aiohttp import ClientTimeout, TCPConnector
 import certifi
 
+try:
+    import aiodns  # noqa: F401 - required by aiohttp.AsyncResolver
+    from aiohttp.resolver import AsyncResolver
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
 # Disable SSL warnings for testing
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -50,13 +57,15 @@ class EnhancedDocumentExtractor:
         ssl_context.check_hostname = False
         ssl_context.verify_mode = ssl.CERT_NONE
         
-        # Create connector with enhanced settings
+        # Create connector with enhanced settings (non-blocking DNS when aiodns is installed)
         connector = TCPConnector(
             ssl=ssl_context,
+            resolver=AsyncResolver() if AIODNS_AVAILABLE else None,
             limit=100,
             limit_per_host=10,
             ttl_dns_cache=300,
             use_dns_cache=True,
+            keepalive_timeout=60,
             enable_cleanup_closed=True
         )
         
@@ -6,16 +6,21 @@ Optimized for 370M+ documents from 1,000+ sources
 
 import asyncio
 import aiohttp
+import concurrent.futures
+import hashlib
+import io
 import logging
+import os
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timedelta
 import random
 import json
 import re
-from urllib.parse import urljoin, urlparse
-import hashlib
+from urllib.parse import urljoin, urlparse, urlsplit
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
 import time
+from functools import lru_cache
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -23,12 +28,54 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
 from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
+from soupsieve import SelectorSyntaxError
 import feedparser
 from fake_useragent import UserAgent
 
+# Optional C-backed JSON for API response parsing (falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from lxml.cssselect import CSSSelector, SelectorError
+    LXML_CSS_AVAILABLE = True
+except ImportError:
+    LXML_CSS_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# PDF text backends: PDFium (native) is preferred, pdfplumber is the pure-Python fallback
+try:
+    import pypdfium2 as pdfium
+    PYPDFIUM2_AVAILABLE = True
+except ImportError:
+    PYPDFIUM2_AVAILABLE = False
+
+try:
+    import pdfplumber
+    PDFPLUMBER_AVAILABLE = True
+except ImportError:
+    PDFPLUMBER_AVAILABLE = False
+
+# Async file I/O for the on-disk PDF cache (falls back to the default executor)
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
 from legal_models import (
     LegalDocument, LegalDocumentCreate, DocumentType, 
     SourceType, ProcessingStatus, PrecedentialValue,
@@ -38,10 +85,235 @@ from legal_sources_config import (
     COMPREHENSIVE_SOURCES, AI_PROCESSING_CONFIG, 
     PERFORMANCE_CONFIG, get_source_config
 )
+from specialized_processors import contains_digit
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Content types servers commonly use for PDFs they don't label application/pdf
+_GENERIC_BINARY_CONTENT_TYPES = frozenset({'application/octet-stream', 'binary/octet-stream', 'application/x-download'})
+
+def _is_pdf_response(url: str, content_type: str) -> bool:
+    """True for application/pdf responses, or generic binary ones whose URL path ends in .pdf"""
+    if content_type == 'application/pdf':
+        return True
+    return content_type in _GENERIC_BINARY_CONTENT_TYPES and urlsplit(url).path.lower().endswith('.pdf')
+
+if LXML_CSS_AVAILABLE:
+    # Decoding is left to aiohttp; the parser is told the text it receives is UTF-8 so
+    # pages carrying an XML encoding declaration still parse
+    _HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+@lru_cache(maxsize=1024)
+def _compile_css_selector(selector: str) -> Optional["CSSSelector"]:
+    """Compile a CSS selector to an lxml XPath once; None if it cannot be translated"""
+    try:
+        return CSSSelector(selector, translator='html')
+    except SelectorError:
+        return None
+
+def _iter_body_blocks(markup: str):
+    """Yield each direct child of <body> once it is fully parsed, then free it
+    
+    Only the block being matched (plus the open <html>/<body> shells) is ever held
+    in memory. Script and style elements are dropped, at the top level or nested.
+    """
+    context = lxml.etree.iterparse(
+        io.BytesIO(markup.encode('utf-8')), events=('end',),
+        html=True, encoding='utf-8', remove_comments=True
+    )
+    for _, element in context:
+        parent = element.getparent()
+        if parent is None or parent.tag != 'body':
+            continue
+        
+        if element.tag not in ('script', 'style'):
+            lxml.etree.strip_elements(element, 'script', 'style', with_tail=False)
+            yield element
+        
+        element.clear(keep_tail=False)
+        while element.getprevious() is not None:
+            del parent[0]
+
+def _stream_select(markup: str, selectors: List[str], limit: int, extract) -> Dict[str, list]:
+    """First `limit` matches of each selector, reduced with extract(), without a full tree
+    
+    Selectors are matched within each top-level block, so a selector can't rely on
+    classes carried by <body> or <html> themselves.
+    """
+    matches = {selector: [] for selector in selectors}
+    for block in _iter_body_blocks(markup):
+        for selector in selectors:
+            found = matches[selector]
+            compiled = _compile_css_selector(selector)
+            if compiled is None or len(found) >= limit:
+                continue
+            found.extend(extract(element) for element in compiled(block)[:limit - len(found)])
+    return matches
+
+# PDFs with at least this many pages are split across the process pool in chunks
+PDF_PARALLEL_MIN_PAGES = 32
+PDF_PAGES_PER_TASK = 16
+
+def _pdf_page_count(pdf_bytes: bytes) -> int:
+    """Number of pages in a PDF (runs in a worker process)"""
+    if PYPDFIUM2_AVAILABLE:
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        return len(pdf.pages)
+
+def _pdf_extract_sync(pdf_bytes: bytes, start: int = 0, end: Optional[int] = None) -> str:
+    """Extract the text of pages [start, end) of a PDF, or all of it (runs in a worker process)
+    
+    Pages are written out one at a time and closed as soon as their text is taken,
+    so only one page's layout objects are cached at once.
+    """
+    if PYPDFIUM2_AVAILABLE:
+        return _pdfium_extract(pdf_bytes, start, end)
+    
+    page_numbers = None if end is None else list(range(start + 1, end + 1))  # pdfplumber counts from 1
+    buffer = io.StringIO()
+    with pdfplumber.open(io.BytesIO(pdf_bytes), pages=page_numbers) as pdf:
+        for index, page in enumerate(pdf.pages):
+            if index:
+                buffer.write("\n")
+            buffer.write(page.extract_text() or '')
+            page.close()
+    return buffer.getvalue()
+
+def _pdfium_extract(pdf_bytes: bytes, start: int, end: Optional[int]) -> str:
+    """PDFium counterpart of the pdfplumber loop in _pdf_extract_sync"""
+    buffer = io.StringIO()
+    pdf = pdfium.PdfDocument(pdf_bytes)
+    try:
+        for index in range(start, len(pdf) if end is None else end):
+            if index > start:
+                buffer.write("\n")
+            page = pdf[index]
+            textpage = page.get_textpage()
+            buffer.write(textpage.get_text_range().replace("\r\n", "\n"))
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    return buffer.getvalue()
+
+# RSS <item> and Atom <entry> elements, in any namespace
+_FEED_ITEM_TAGS = ('{*}item', '{*}entry')
+
+def _feed_child_text(item, *tags: str) -> Optional[str]:
+    """Stripped text of the first of `tags` present with non-empty text under a feed item"""
+    for tag in tags:
+        child = item.find(tag)
+        if child is not None and child.text and child.text.strip():
+            return child.text.strip()
+    return None
+
+def _iter_feed_items(feed_bytes: bytes):
+    """Stream RSS/Atom items as document dicts, freeing each element once it is read"""
+    context = lxml.etree.iterparse(
+        io.BytesIO(feed_bytes), events=('end',), tag=_FEED_ITEM_TAGS,
+        recover=True, huge_tree=True, resolve_entities=False, no_network=True
+    )
+    for _, item in context:
+        content = _feed_child_text(item, '{*}encoded', '{*}content', '{*}description', '{*}summary')
+        if content and '<' in content:
+            # Item bodies are usually escaped HTML; keep only their text
+            content = ' '.join(lxml.html.fromstring(content).text_content().split()) or None
+        
+        link = item.find('{*}link')
+        yield {
+            'title': _feed_child_text(item, '{*}title'),
+            'content': content,
+            'court': None,
+            'date_text': _feed_child_text(item, '{*}pubDate', '{*}published', '{*}updated', '{*}date'),
+            'url': None if link is None else (link.text or '').strip() or link.get('href')
+        }
+        
+        item.clear(keep_tail=True)
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+
+# Candidate document link selectors, tried in order on a source's landing page
+DOCUMENT_LINK_SELECTORS = [
+    'a[href*="case"]',
+    'a[href*="decision"]',
+    'a[href*="opinion"]',
+    'a[href*="document"]',
+    '.case-link a',
+    '.document-link a',
+    '.judgment-link a'
+]
+
+# True once the load event fired at least `arguments[0]` ms ago, i.e. the page has
+# finished loading and had a moment to settle
+_PAGE_SETTLED_SCRIPT = """
+const timing = window.performance.timing;
+return document.readyState === 'complete' && timing.loadEventEnd > 0 &&
+    performance.now() - (timing.loadEventEnd - timing.navigationStart) > arguments[0];
+"""
+
+# Pages larger than this (in characters) are matched block by block instead of
+# being parsed into one tree, capping peak memory on very large court opinions
+STREAMING_PARSE_THRESHOLD = 500_000
+
+# Extracted documents kept per engine, both by URL (skips the re-download) and by
+# markup digest (skips re-parsing identical pages served under different URLs)
+DOCUMENT_CACHE_SIZE = 4096
+
+# Collects hrefs for every selector in one WebDriver round trip: the first
+# `perSelector` matches of each selector, de-duplicated in selector order
+_DOCUMENT_LINKS_SCRIPT = """
+const selectors = arguments[0], perSelector = arguments[1];
+const seen = new Set(), links = [];
+for (const selector of selectors) {
+    let elements;
+    try {
+        elements = document.querySelectorAll(selector);
+    } catch (e) {
+        continue;
+    }
+    for (const el of Array.prototype.slice.call(elements, 0, perSelector)) {
+        const href = typeof el.href === 'string' ? el.href : el.getAttribute('href');
+        if (href && !seen.has(href)) {
+            seen.add(href);
+            links.push(href);
+        }
+    }
+}
+return links;
+"""
+
+# Resolves several fields at once: for each field, the trimmed innerText of the
+# first element matched by the first selector that yields non-empty text
+_DOCUMENT_FIELDS_SCRIPT = """
+const fieldSelectors = arguments[0], fields = {};
+for (const [field, selectors] of Object.entries(fieldSelectors)) {
+    fields[field] = null;
+    for (const selector of selectors) {
+        let element;
+        try {
+            element = document.querySelector(selector);
+        } catch (e) {
+            continue;
+        }
+        const text = element ? (element.innerText || '').trim() : '';
+        if (text) {
+            fields[field] = text;
+            break;
+        }
+    }
+}
+return fields;
+"""
+
+@dataclass(slots=True)
 class ScrapingResult:
     success: bool
     documents: List[Dict[str, Any]]
@@ -63,6 +335,14 @@ class AIContentProcessor:
             'cfr': re.compile(r'\b\d+\s+C\.F\.R\.\s+§\s+\d+\b')
         }
         
+        # Patterns for case names like "Smith v. Jones" or "United States v. Defendant"
+        self.case_patterns = [
+            re.compile(r'([A-Z][a-zA-Z\s&\.]+)\s+v\.\s+([A-Z][a-zA-Z\s&\.]+)'),
+            re.compile(r'([A-Z][a-zA-Z\s&\.]+)\s+vs?\.\s+([A-Z][a-zA-Z\s&\.]+)'),
+            re.compile(r'In\s+re:?\s+([A-Z][a-zA-Z\s&\.]+)'),
+            re.compile(r'Ex\s+parte:?\s+([A-Z][a-zA-Z\s&\.]+)')
+        ]
+        
         self.legal_topics = {
             'constitutional': ['constitution', 'amendment', 'bill of rights', 'due process'],
             'contract': ['contract', 'agreement', 'breach', 'consideration', 'offer', 'acceptance'],
@@ -79,9 +359,31 @@ class AIContentProcessor:
             'bankruptcy': ['bankruptcy', 'debt', 'creditor', 'Chapter 7', 'Chapter 11'],
             'antitrust': ['antitrust', 'monopoly', 'competition', 'merger', 'market share']
         }
+        self._topic_automaton = self._build_topic_automaton() if AHOCORASICK_AVAILABLE else None
+    
+    def _build_topic_automaton(self):
+        """Aho-Corasick automaton over every topic keyword
+        
+        Each value lists the (topic, position) slots the keyword fills, so a keyword
+        shared by several topics (e.g. 'merger') counts toward each of them. Keywords
+        are added as written and matched against lowercased text, like the loop below.
+        """
+        entries = {}
+        for topic, keywords in self.legal_topics.items():
+            for position, keyword in enumerate(keywords):
+                entries.setdefault(keyword, []).append((topic, position))
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, slots in entries.items():
+            automaton.add_word(keyword, tuple(slots))
+        automaton.make_automaton()
+        return automaton
     
     def extract_citations(self, text: str) -> List[str]:
         """Extract legal citations using AI-enhanced pattern matching"""
+        if not contains_digit(text):
+            return []
+        
         citations = []
         for pattern_name, pattern in self.citation_patterns.items():
             matches = pattern.findall(text)
@@ -95,6 +397,14 @@ class AIContentProcessor:
         text_lower = text.lower()
         topics = []
         
+        if self._topic_automaton is not None:
+            # One pass over the text for all keywords; each keyword counts once per topic
+            matched = set()
+            for _, slots in self._topic_automaton.iter(text_lower):
+                matched.update(slots)
+            keyword_counts = Counter(topic for topic, _ in matched)
+            return [topic for topic in self.legal_topics if keyword_counts[topic] >= 2]
+        
         for topic, keywords in self.legal_topics.items():
             keyword_count = sum(1 for keyword in keywords if keyword in text_lower)
             if keyword_count >= 2:  # Require at least 2 keyword matches
@@ -107,15 +417,7 @@ class AIContentProcessor:
         parties = []
         
         if document_type == DocumentType.CASE_LAW:
-            # Pattern for case names like "Smith v. Jones" or "United States v. Defendant"
-            case_patterns = [
-                re.compile(r'([A-Z][a-zA-Z\s&\.]+)\s+v\.\s+([A-Z][a-zA-Z\s&\.]+)'),
-                re.compile(r'([A-Z][a-zA-Z\s&\.]+)\s+vs?\.\s+([A-Z][a-zA-Z\s&\.]+)'),
-                re.compile(r'In\s+re:?\s+([A-Z][a-zA-Z\s&\.]+)'),
-                re.compile(r'Ex\s+parte:?\s+([A-Z][a-zA-Z\s&\.]+)')
-            ]
-            
-            for pattern in case_patterns:
+            for pattern in self.case_patterns:
                 matches = pattern.finditer(text)
                 for match in matches:
                     parties.extend([group.strip() for group in match.groups() if group.strip()])
@@ -184,7 +486,19 @@ class IntelligentScrapingEngine:
     
     def __init__(self):
         self.session_pool = {}
-        self.driver_pool = {}
+        # Idle Chrome drivers reused across web sources (created lazily, up to the pool size)
+        self.driver_pool: Optional[asyncio.Queue] = None
+        self.driver_pool_size = int(os.environ.get('SCRAPER_DRIVER_POOL_SIZE', 4))
+        self._drivers_created = 0
+        # Domains whose pages only render in a real browser
+        self.browser_required_domains: set = set()
+        # Worker processes for CPU-bound PDF parsing (created on first use)
+        self._pdf_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        # LRU caches of extracted document fields (see DOCUMENT_CACHE_SIZE)
+        self._document_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._markup_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        # Downloaded PDFs are kept on disk when a cache directory is configured
+        self.pdf_cache_dir: Optional[str] = os.environ.get('SCRAPER_PDF_CACHE_DIR') or None
         self.ai_processor = AIContentProcessor()
         self.user_agent = UserAgent()
         self.request_history = {}
@@ -247,8 +561,56 @@ class IntelligentScrapingEngine:
         # Remove automation indicators
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
+        # Pooled drivers only ever use explicit waits; pin the implicit wait to zero
+        # so lookups that miss return immediately
+        driver.implicitly_wait(0)
+        
         return driver
     
+    async def _acquire_driver(self) -> webdriver.Chrome:
+        """Take an idle pooled driver, starting a new one while the pool is below capacity"""
+        if self.driver_pool is None:
+            self.driver_pool = asyncio.Queue()
+        
+        if self.driver_pool.empty() and self._drivers_created < self.driver_pool_size:
+            self._drivers_created += 1
+            try:
+                return self.create_intelligent_driver()
+            except Exception:
+                self._drivers_created -= 1
+                raise
+        
+        return await self.driver_pool.get()
+    
+    def _release_driver(self, driver: webdriver.Chrome, healthy: bool = True):
+        """Reset a driver's session state and return it to the pool, or quit it if broken"""
+        if healthy:
+            try:
+                driver.delete_all_cookies()
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except WebDriverException:
+                healthy = False
+        
+        if healthy:
+            self.driver_pool.put_nowait(driver)
+            return
+        
+        self._drivers_created -= 1
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logger.debug(f"Error quitting broken driver: {e}")
+    
+    def close_driver_pool(self):
+        """Quit every idle pooled driver"""
+        while self.driver_pool is not None and not self.driver_pool.empty():
+            driver = self.driver_pool.get_nowait()
+            self._drivers_created -= 1
+            try:
+                driver.quit()
+            except WebDriverException as e:
+                logger.debug(f"Error quitting pooled driver: {e}")
+    
     async def adaptive_rate_limiting(self, source_id: str):
         """AI-powered adaptive rate limiting based on source behavior"""
         source_config = get_source_config(source_id)
@@ -297,7 +659,7 @@ class IntelligentScrapingEngine:
                 try:
                     async with self.session.get(url, headers=request_headers) as response:
                         if response.status == 200:
-                            data = await response.json()
+                            data = await response.json(loads=_json_loads)
                             processed_docs = await self.process_api_response(
                                 data, source_id, source_config, endpoint_name
                             )
@@ -343,15 +705,16 @@ class IntelligentScrapingEngine:
         documents = []
         errors = []
         driver = None
+        driver_healthy = True
         
         try:
-            driver = self.create_intelligent_driver()
+            driver = await self._acquire_driver()
             base_url = source_config['base_url']
             selectors = source_config.get('selectors', {})
             
             # Navigate to base URL
-            driver.get(base_url)
-            await asyncio.sleep(random.uniform(2, 5))  # Human-like delay
+            await self.navigate(driver, base_url)
+            await self.wait_for_page_settled(driver)
             
             # Find document links
             document_links = await self.find_document_links(driver, source_config)
@@ -360,13 +723,17 @@ class IntelligentScrapingEngine:
                 await self.adaptive_rate_limiting(source_id)
                 
                 try:
-                    driver.get(link)
-                    await asyncio.sleep(random.uniform(1, 3))
-                    
-                    # Extract document content
-                    doc_data = await self.extract_document_content(
-                        driver, source_config, link
-                    )
+                    doc_data = self._cached_document(link)
+                    if doc_data is None:
+                        await self.navigate(driver, link)
+                        await self.wait_for_page_settled(driver)
+                        
+                        # Extract document content
+                        doc_data = await self.extract_document_content(
+                            driver, source_config, link
+                        )
+                        if doc_data and doc_data.get('content'):
+                            self._remember_document(self._document_cache, link, doc_data)
                     
                     if doc_data:
                         documents.append(doc_data)
@@ -381,10 +748,11 @@ class IntelligentScrapingEngine:
         
         except Exception as e:
             errors.append(f"Fatal error in web scraping: {str(e)}")
+            driver_healthy = not isinstance(e, WebDriverException)
         
         finally:
             if driver:
-                driver.quit()
+                self._release_driver(driver, healthy=driver_healthy)
         
         processing_time = time.time() - start_time
         
@@ -398,6 +766,338 @@ class IntelligentScrapingEngine:
             metadata={'links_processed': len(document_links) if 'document_links' in locals() else 0}
         )
     
+    async def navigate(self, driver: webdriver.Chrome, url: str):
+        """Load url in the driver without blocking the event loop
+        
+        driver.get only returns once the page has loaded; running it in the default
+        executor lets pooled drivers for other sources load pages concurrently.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, driver.get, url)
+    
+    async def wait_for_page_settled(self, driver: webdriver.Chrome, timeout: float = 10, quiet_ms: int = 500):
+        """Wait for the current page to finish loading instead of sleeping a fixed time
+        
+        Pacing between requests is left to adaptive_rate_limiting. The blocking
+        WebDriverWait runs in the default executor so the event loop stays free.
+        """
+        def _wait():
+            try:
+                WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                    lambda d: d.execute_script(_PAGE_SETTLED_SCRIPT, quiet_ms)
+                )
+            except TimeoutException:
+                logger.debug(f"Page did not settle within {timeout}s; continuing")
+        
+        await asyncio.get_running_loop().run_in_executor(None, _wait)
+    
+    async def scrape_rss_source(self, source_id: str, source_config: Dict[str, Any]) -> ScrapingResult:
+        """Scrape RSS/Atom feeds with the pooled aiohttp session and a streaming lxml parser"""
+        start_time = time.time()
+        documents = []
+        errors = []
+        feed_urls = source_config.get('rss_feeds') or [source_config['base_url']]
+        
+        for feed_url in feed_urls:
+            await self.adaptive_rate_limiting(source_id)
+            
+            try:
+                async with self.session.get(feed_url) as response:
+                    response.raise_for_status()
+                    feed_bytes = await response.read()
+                
+                for doc_data in _iter_feed_items(feed_bytes):
+                    if doc_data['content'] or doc_data['title']:
+                        documents.append(doc_data)
+                    if len(documents) >= 100:  # Same per-session cap as the web paths
+                        break
+                self.track_request_success(source_id, feed_url, True)
+            
+            except Exception as e:
+                errors.append(f"Error processing feed {feed_url}: {str(e)}")
+                self.track_request_success(source_id, feed_url, False)
+            
+            if len(documents) >= 100:
+                break
+        
+        return ScrapingResult(
+            success=len(documents) > 0,
+            documents=documents,
+            errors=errors,
+            source_id=source_id,
+            processing_time=time.time() - start_time,
+            documents_found=len(documents),
+            metadata={'feeds_processed': len(feed_urls), 'method': 'rss'}
+        )
+    
+    async def scrape_web_source_adaptive(self, source_id: str, source_config: Dict[str, Any]) -> ScrapingResult:
+        """Scrape a web source over plain HTTP first, starting Chrome only when needed
+        
+        Domains whose landing page loads but yields no documents without a browser
+        are remembered, and later sources on them go straight to Selenium. Failed
+        fetches (DNS, timeouts, 5xx) fall back for this call only.
+        """
+        domain = urlparse(source_config['base_url']).netloc
+        
+        if getattr(self, 'session', None) is not None and domain not in self.browser_required_domains:
+            result = await self.scrape_web_source_http(source_id, source_config)
+            if result.success:
+                return result
+            
+            if result.metadata.get('landing_fetched'):
+                self.browser_required_domains.add(domain)
+                logger.info(f"🌐 {domain} needs a browser; falling back to Selenium for {source_id}")
+            else:
+                logger.info(f"🌐 HTTP fetch failed for {source_id}; falling back to Selenium")
+        
+        return await self.scrape_web_source(source_id, source_config)
+    
+    async def scrape_web_source_http(self, source_id: str, source_config: Dict[str, Any]) -> ScrapingResult:
+        """Scrape a web source with the pooled aiohttp session and static HTML parsing"""
+        start_time = time.time()
+        documents = []
+        errors = []
+        document_links = []
+        landing_fetched = False
+        
+        try:
+            base_url = source_config['base_url']
+            field_selectors = self.resolve_field_selectors(source_config)
+            
+            async with self.session.get(base_url) as response:
+                response.raise_for_status()
+                landing_markup = await response.text()
+            landing_fetched = True
+            
+            if LXML_CSS_AVAILABLE and len(landing_markup) > STREAMING_PARSE_THRESHOLD:
+                hrefs_by_selector = _stream_select(
+                    landing_markup, DOCUMENT_LINK_SELECTORS, 50, lambda element: element.get('href')
+                )
+            else:
+                landing_page = self._parse_static_page(landing_markup)
+                hrefs_by_selector = {
+                    selector: [element.get('href') for element in self._select_static(landing_page, selector)[:50]]
+                    for selector in DOCUMENT_LINK_SELECTORS
+                }
+            
+            # Same link discovery rules as the browser path, de-duplicated through a set
+            # rather than list membership scans
+            seen_links = set()
+            for selector in DOCUMENT_LINK_SELECTORS:
+                for href in hrefs_by_selector[selector]:
+                    link = urljoin(base_url, href) if href else None
+                    if link and link not in seen_links:
+                        seen_links.add(link)
+                        document_links.append(link)
+            
+            for link in document_links[:100]:  # Process first 100 documents per session
+                try:
+                    doc_data = self._cached_document(link)
+                    if doc_data is None:
+                        await self.adaptive_rate_limiting(source_id)
+                        doc_data = await self._fetch_static_document(link, field_selectors)
+                    
+                    if doc_data['content']:
+                        documents.append(doc_data)
+                        self.track_request_success(source_id, link, True)
+                    else:
+                        errors.append(f"No content extracted from: {link}")
+                        self.track_request_success(source_id, link, False)
+                
+                except Exception as e:
+                    errors.append(f"Error processing {link}: {str(e)}")
+                    self.track_request_success(source_id, link, False)
+        
+        except Exception as e:
+            errors.append(f"Fatal error in HTTP scraping: {str(e)}")
+        
+        return ScrapingResult(
+            success=len(documents) > 0,
+            documents=documents,
+            errors=errors,
+            source_id=source_id,
+            processing_time=time.time() - start_time,
+            documents_found=len(documents),
+            metadata={'links_processed': len(document_links), 'landing_fetched': landing_fetched, 'method': 'http'}
+        )
+    
+    async def _fetch_static_document(self, link: str, field_selectors: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Download one document and extract its fields, reusing the parse of identical markup"""
+        payload, markup = await self._read_cached_pdf(link), None
+        if payload is None:
+            async with self.session.get(link) as response:
+                response.raise_for_status()
+                if _is_pdf_response(link, response.content_type):
+                    payload = await response.read()
+                else:
+                    markup = await response.text()
+                    payload = markup.encode('utf-8')
+            if markup is None:
+                await self._write_cached_pdf(link, payload)
+        
+        # Selectors are part of the key: the same page yields different fields per source config
+        digest = hashlib.blake2b(payload, digest_size=16)
+        digest.update(repr(sorted(field_selectors.items())).encode('utf-8'))
+        digest = digest.digest()
+        
+        fields = self._markup_cache.get(digest)
+        if fields is not None:
+            self._markup_cache.move_to_end(digest)
+        else:
+            if markup is None:
+                # PDFs carry no HTML fields; only the text body is recovered
+                fields = dict.fromkeys(field_selectors)
+                fields['content'] = await self.extract_pdf_content(payload)
+            elif LXML_CSS_AVAILABLE and len(markup) > STREAMING_PARSE_THRESHOLD:
+                fields = self._extract_fields_streaming(markup, field_selectors)
+            else:
+                page = self._parse_static_page(markup)
+                fields = {
+                    field: self._select_first_text(page, selectors)
+                    for field, selectors in field_selectors.items()
+                }
+            self._remember_document(self._markup_cache, digest, fields)
+        
+        doc_data = {**fields, 'url': link}
+        if doc_data['content']:
+            self._remember_document(self._document_cache, link, doc_data)
+        return doc_data
+    
+    def _pdf_cache_path(self, url: str) -> str:
+        return os.path.join(self.pdf_cache_dir, hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest() + '.pdf')
+    
+    async def _read_cached_pdf(self, url: str) -> Optional[bytes]:
+        """PDF bytes previously downloaded from url, or None on a cache miss"""
+        if not self.pdf_cache_dir:
+            return None
+        
+        path = self._pdf_cache_path(url)
+        try:
+            if AIOFILES_AVAILABLE:
+                async with aiofiles.open(path, 'rb') as cached:
+                    return await cached.read()
+            
+            def _read():
+                with open(path, 'rb') as cached:
+                    return cached.read()
+            return await asyncio.get_running_loop().run_in_executor(None, _read)
+        except FileNotFoundError:
+            return None
+    
+    async def _write_cached_pdf(self, url: str, pdf_bytes: bytes):
+        """Store a downloaded PDF; written to a temporary name first so readers never see a partial file"""
+        if not self.pdf_cache_dir:
+            return
+        
+        path = self._pdf_cache_path(url)
+        partial_path = f"{path}.{os.getpid()}-{random.getrandbits(32):08x}.part"
+        try:
+            os.makedirs(self.pdf_cache_dir, exist_ok=True)
+            if AIOFILES_AVAILABLE:
+                async with aiofiles.open(partial_path, 'wb') as cached:
+                    await cached.write(pdf_bytes)
+            else:
+                def _write():
+                    with open(partial_path, 'wb') as cached:
+                        cached.write(pdf_bytes)
+                await asyncio.get_running_loop().run_in_executor(None, _write)
+            os.replace(partial_path, path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not cache PDF from {url}: {e}")
+    
+    def _cached_document(self, url: str) -> Optional[Dict[str, Any]]:
+        """Copy of the document previously extracted from url, or None"""
+        doc_data = self._document_cache.get(url)
+        if doc_data is None:
+            return None
+        self._document_cache.move_to_end(url)
+        return dict(doc_data)
+    
+    @staticmethod
+    def _remember_document(cache: OrderedDict, key, doc_data: Dict[str, Any]):
+        """Store a copy of doc_data in an LRU cache, evicting the oldest entry when full"""
+        cache[key] = dict(doc_data)
+        cache.move_to_end(key)
+        if len(cache) > DOCUMENT_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    @staticmethod
+    def _parse_static_page(markup: str):
+        """Parse HTML with lxml when its CSS support is installed, otherwise with BeautifulSoup"""
+        if not LXML_CSS_AVAILABLE:
+            return BeautifulSoup(markup, 'lxml')
+        
+        page = lxml.html.fromstring(markup.encode('utf-8'), parser=_HTML_PARSER)
+        # Script and style bodies are not visible text (BeautifulSoup's get_text skips them too)
+        for element in list(page.iter('script', 'style')):
+            element.drop_tree()
+        return page
+    
+    @staticmethod
+    def _select_static(page, selector: str) -> list:
+        """Elements matching selector; invalid selectors match nothing, as in the browser scripts"""
+        if LXML_CSS_AVAILABLE:
+            compiled = _compile_css_selector(selector)
+            return compiled(page) if compiled is not None else []
+        
+        try:
+            return page.select(selector)
+        except SelectorSyntaxError:
+            return []
+    
+    @classmethod
+    def _select_first_text(cls, page, selectors: List[str]) -> Optional[str]:
+        """Static-HTML counterpart of _DOCUMENT_FIELDS_SCRIPT for a single field"""
+        for selector in selectors:
+            elements = cls._select_static(page, selector)
+            if not elements:
+                continue
+            if LXML_CSS_AVAILABLE:
+                text = ' '.join(elements[0].text_content().split())
+            else:
+                text = elements[0].get_text(' ', strip=True)
+            if text:
+                return text
+        return None
+    
+    @staticmethod
+    def _extract_fields_streaming(markup: str, field_selectors: Dict[str, List[str]]) -> Dict[str, Optional[str]]:
+        """_select_first_text for every field of a very large page, in one streaming pass"""
+        selectors = list(dict.fromkeys(selector for group in field_selectors.values() for selector in group))
+        first_texts = _stream_select(
+            markup, selectors, 1, lambda element: ' '.join(''.join(element.itertext()).split())
+        )
+        return {
+            field: next((first_texts[selector][0] for selector in group if first_texts[selector] and first_texts[selector][0]), None)
+            for field, group in field_selectors.items()
+        }
+    
+    async def extract_pdf_content(self, pdf_bytes: bytes) -> Optional[str]:
+        """Extract PDF text in the process pool so parsing never blocks the event loop"""
+        if not (PYPDFIUM2_AVAILABLE or PDFPLUMBER_AVAILABLE):
+            logger.warning("⚠️ Neither pypdfium2 nor pdfplumber is installed; skipping PDF document")
+            return None
+        
+        if self._pdf_pool is None:
+            self._pdf_pool = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+        
+        loop = asyncio.get_running_loop()
+        page_count = await loop.run_in_executor(self._pdf_pool, _pdf_page_count, pdf_bytes)
+        
+        if page_count < PDF_PARALLEL_MIN_PAGES:
+            text = await loop.run_in_executor(self._pdf_pool, _pdf_extract_sync, pdf_bytes)
+        else:
+            # Pages are independent, so long documents are spread over every worker
+            chunks = await asyncio.gather(*(
+                loop.run_in_executor(
+                    self._pdf_pool, _pdf_extract_sync, pdf_bytes,
+                    start, min(start + PDF_PAGES_PER_TASK, page_count)
+                )
+                for start in range(0, page_count, PDF_PAGES_PER_TASK)
+            ))
+            text = "\n".join(chunks)
+        
+        return text.strip() or None
+    
     async def process_api_response(
         self, 
         data: Dict[str, Any], 
@@ -565,30 +1265,12 @@ class IntelligentScrapingEngine:
     
     async def find_document_links(self, driver: webdriver.Chrome, source_config: Dict[str, Any]) -> List[str]:
         """Find document links on the page using intelligent selectors"""
-        links = []
-        
-        # Try multiple selector strategies
-        selectors = [
-            'a[href*="case"]',
-            'a[href*="decision"]',
-            'a[href*="opinion"]',
-            'a[href*="document"]',
-            '.case-link a',
-            '.document-link a',
-            '.judgment-link a'
-        ]
-        
-        for selector in selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements[:50]:  # Limit to first 50 per selector
-                    href = element.get_attribute('href')
-                    if href and href not in links:
-                        links.append(href)
-            except Exception as e:
-                logger.debug(f"Selector {selector} failed: {e}")
-        
-        return links
+        # Evaluate all selectors in the browser instead of one round trip per element
+        try:
+            return driver.execute_script(_DOCUMENT_LINKS_SCRIPT, DOCUMENT_LINK_SELECTORS, 50) or []  # Limit to first 50 per selector
+        except WebDriverException as e:
+            logger.debug(f"Document link discovery failed: {e}")
+            return []
     
     async def extract_document_content(
         self, 
@@ -597,36 +1279,22 @@ class IntelligentScrapingEngine:
         url: str
     ) -> Optional[Dict[str, Any]]:
         """Extract document content using intelligent selectors"""
-        selectors = source_config.get('selectors', {})
-        
         try:
-            # Wait for page to load
-            WebDriverWait(driver, 10).until(
+            # The page has already settled (wait_for_page_settled), so only a short
+            # explicit wait is needed; documents without a <body> fail fast
+            WebDriverWait(driver, 2).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
             
-            # Extract content using configured selectors
-            title = self.extract_text_by_selectors(
-                driver, selectors.get('case_title', ['h1', 'h2', '.title', '.case-title'])
-            )
-            
-            content = self.extract_text_by_selectors(
-                driver, selectors.get('content', ['.content', '.opinion', '.judgment', '.decision'])
-            )
-            
-            court = self.extract_text_by_selectors(
-                driver, selectors.get('court_name', ['.court', '.court-name'])
-            )
-            
-            date_text = self.extract_text_by_selectors(
-                driver, selectors.get('date', ['.date', '.filed-date', '.decision-date'])
-            )
+            # Extract content using configured selectors, all fields in one browser round trip
+            field_selectors = self.resolve_field_selectors(source_config)
+            fields = driver.execute_script(_DOCUMENT_FIELDS_SCRIPT, field_selectors) or {}
             
             return {
-                'title': title,
-                'content': content,
-                'court': court,
-                'date_text': date_text,
+                'title': fields.get('title'),
+                'content': fields.get('content'),
+                'court': fields.get('court'),
+                'date_text': fields.get('date_text'),
                 'url': url
             }
             
@@ -634,23 +1302,35 @@ class IntelligentScrapingEngine:
             logger.error(f"Error extracting content from {url}: {e}")
             return None
     
+    def resolve_field_selectors(self, source_config: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Selector fallback lists for each document field, from source config or defaults"""
+        selectors = source_config.get('selectors', {})
+        field_selectors = {
+            'title': selectors.get('case_title', ['h1', 'h2', '.title', '.case-title']),
+            'content': selectors.get('content', ['.content', '.opinion', '.judgment', '.decision']),
+            'court': selectors.get('court_name', ['.court', '.court-name']),
+            'date_text': selectors.get('date', ['.date', '.filed-date', '.decision-date'])
+        }
+        return {
+            field: [field_selector] if isinstance(field_selector, str) else list(field_selector)
+            for field, field_selector in field_selectors.items()
+        }
+    
     def extract_text_by_selectors(self, driver: webdriver.Chrome, selectors: List[str]) -> Optional[str]:
         """Extract text using multiple selector fallbacks"""
         if isinstance(selectors, str):
             selectors = [selectors]
         
-        for selector in selectors:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                text = element.text.strip()
-                if text:
-                    return text
-            except NoSuchElementException:
-                continue
-        
-        return None
+        # Every fallback is tried in the browser, rather than a find_element and an
+        # element.text round trip per selector
+        fields = driver.execute_script(_DOCUMENT_FIELDS_SCRIPT, {'text': list(selectors)}) or {}
+        return fields.get('text')
     
     async def close(self):
         """Clean up resources"""
+        self.close_driver_pool()
+        if self._pdf_pool is not None:
+            self._pdf_pool.shutdown(wait=False, cancel_futures=True)
+            self._pdf_pool = None
         if hasattr(self, 'session'):
             await self.session.close()
\ No newline at end of file
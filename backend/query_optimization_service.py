@@ -21,6 +21,12 @@ from legal_models import LegalDocumentFilter, DocumentType, JurisdictionLevel, P
 
 logger = logging.getLogger(__name__)
 
+# Text-complexity patterns, compiled once rather than on every query analysis
+_BOOLEAN_OPERATOR_PATTERN = re.compile(r'\b(AND|OR|NOT)\b', re.IGNORECASE)
+_QUOTED_PHRASE_PATTERN = re.compile(r'"[^"]*"')
+_WILDCARD_PATTERN = re.compile(r'[*?]')
+_SPECIAL_CHAR_PATTERN = re.compile(r'[()[\]{}]')
+
 class QueryComplexityAnalyzer:
     """Analyze and score query complexity for optimization"""
     
@@ -113,19 +119,19 @@ class QueryComplexityAnalyzer:
         complexity += min(len(text) / 100.0, 2.0)
         
         # Boolean operators
-        boolean_operators = len(re.findall(r'\b(AND|OR|NOT)\b', text, re.IGNORECASE))
+        boolean_operators = len(_BOOLEAN_OPERATOR_PATTERN.findall(text))
         complexity += boolean_operators * 0.5
         
         # Quoted phrases
-        quoted_phrases = len(re.findall(r'"[^"]*"', text))
+        quoted_phrases = len(_QUOTED_PHRASE_PATTERN.findall(text))
         complexity += quoted_phrases * 0.3
         
         # Wildcards
-        wildcards = len(re.findall(r'[*?]', text))
+        wildcards = len(_WILDCARD_PATTERN.findall(text))
         complexity += wildcards * 0.2
         
         # Special characters
-        special_chars = len(re.findall(r'[()[\]{}]', text))
+        special_chars = len(_SPECIAL_CHAR_PATTERN.findall(text))
         complexity += special_chars * 0.1
         
         return min(complexity, 5.0)
@@ -702,7 +708,7 @@ class UltraScaleQueryBuilder:
     def _generate_query_hash(self, search_filter: UltraSearchFilter) -> str:
         """Generate hash for query caching"""
         query_str = str(search_filter.dict(exclude_none=True))
-        return hashlib.md5(query_str.encode()).hexdigest()
+        return hashlib.blake2b(query_str.encode(), digest_size=16).hexdigest()
 
 def convert_ultra_filter_to_legacy(ultra_filter: UltraSearchFilter) -> LegalDocumentFilter:
     """Convert UltraSearchFilter to legacy LegalDocumentFilter for compatibility"""
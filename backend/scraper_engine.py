@@ -32,6 +32,18 @@ from scraper_config import INDIABIX_CONFIG, INDIABIX_SELECTORS, QUALITY_THRESHOL
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Resolve the tree builder once: the C-backed lxml parser when installed, otherwise
+# the pure-Python html.parser (instead of retrying lxml and catching FeatureNotFound per page)
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+def _parse_html(markup: str) -> BeautifulSoup:
+    """Parse HTML with the C-backed lxml parser, falling back to html.parser if lxml is unavailable"""
+    return BeautifulSoup(markup, _HTML_PARSER)
+
 class IndiaBixScraper:
     """
     Advanced scraper for IndiaBix aptitude questions with anti-detection measures
@@ -148,7 +160,7 @@ class IndiaBixScraper:
     def extract_question_from_page(self, page_source: str, url: str) -> Optional[Dict[str, Any]]:
         """Extract question data from HTML page source"""
         try:
-            soup = BeautifulSoup(page_source, 'lxml')
+            soup = _parse_html(page_source)
             
             # Extract question text
             question_element = soup.select_one(INDIABIX_SELECTORS["question_text"])
@@ -179,10 +191,11 @@ class IndiaBixScraper:
             correct_answer = ""
             if answer_element:
                 # Try to find the correct answer text
-                answer_text = answer_element.get_text(strip=True)
+                answer_text = answer_element.get_text(strip=True).lower()
                 # Match with one of the options
                 for option in options:
-                    if option.lower() in answer_text.lower() or answer_text.lower() in option.lower():
+                    option_lower = option.lower()
+                    if option_lower in answer_text or answer_text in option_lower:
                         correct_answer = option
                         break
             
@@ -275,9 +288,12 @@ class IndiaBixScraper:
             # Simulate human behavior
             self.simulate_human_behavior()
             
-            # Extract question from current page
+            # Extract question from current page; parsing runs in a worker thread
+            # so the event loop is not blocked while the page is processed
             page_source = self.driver.page_source
-            question_data = self.extract_question_from_page(page_source, page_url)
+            question_data = await asyncio.get_running_loop().run_in_executor(
+                None, self.extract_question_from_page, page_source, page_url
+            )
             
             if question_data:
                 # Check for duplicates
@@ -322,8 +338,9 @@ class IndiaBixScraper:
             hard_keywords = ['calculate', 'determine', 'analyze', 'complex', 'advanced', 'comprehensive']
             medium_keywords = ['find', 'compute', 'solve', 'identify']
             
-            hard_count = sum(1 for keyword in hard_keywords if keyword in question_text.lower())
-            medium_count = sum(1 for keyword in medium_keywords if keyword in question_text.lower())
+            question_lower = question_text.lower()
+            hard_count = sum(1 for keyword in hard_keywords if keyword in question_lower)
+            medium_count = sum(1 for keyword in medium_keywords if keyword in question_lower)
             
             # Scoring
             if text_length > 50 or hard_count >= 2:
@@ -348,8 +365,9 @@ class IndiaBixScraper:
         }
         
         if category in concept_keywords:
+            question_lower = question_text.lower()
             for keyword in concept_keywords[category]:
-                if keyword in question_text.lower():
+                if keyword in question_lower:
                     concepts.append(keyword)
         
         return list(set(concepts))  # Remove duplicates
@@ -11,8 +11,42 @@ from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import logging
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Regexes shared by every extractor call, compiled once at import
+_YEAR_PATTERN = re.compile(r'\b\d{4}\b')
+_ABBREVIATION_REPLACEMENTS = (
+    (re.compile(r'\bUS\b'), 'U.S.'),
+    (re.compile(r'\bUSC\b'), 'U.S.C.'),
+    (re.compile(r'\bCFR\b'), 'C.F.R.'),
+)
+
+_DIGIT_PATTERN = re.compile(r'\d')
+_ASCII_DIGITS = str.maketrans('', '', '0123456789')
+
+def contains_digit(text: str) -> bool:
+    """True if text contains a digit
+    
+    Every citation pattern needs at least one, so documents without digits can
+    skip the regex scans. ASCII text is checked with one C-level translate pass.
+    """
+    if text.isascii():
+        return len(text.translate(_ASCII_DIGITS)) != len(text)
+    return _DIGIT_PATTERN.search(text) is not None
+
+def _compile_pattern_table(table: Dict[str, List[str]]) -> Dict[str, List[re.Pattern]]:
+    """Compile a {category: [pattern, ...]} table case-insensitively"""
+    return {
+        category: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        for category, patterns in table.items()
+    }
+
 # ================================================================================================
 # SPECIALIZED CITATION EXTRACTORS
 # ================================================================================================
@@ -38,7 +72,7 @@ class USFederalCitationExtractor(BaseCitationExtractor):
     
     def __init__(self):
         super().__init__()
-        self.citation_patterns = {
+        self.citation_patterns = _compile_pattern_table({
             'supreme_court': [
                 r'(\d+)\s+U\.S\.\s+(\d+)\s*\((\d{4})\)',  # Standard format
                 r'(\d+)\s+US\s+(\d+)\s*\((\d{4})\)',      # Alternative format
@@ -64,15 +98,18 @@ class USFederalCitationExtractor(BaseCitationExtractor):
                 r'(\d+)\s+Fed\.\s*Reg\.\s+(\d+(?:,\d+)*)\s*\((\w+\.?\s+\d+,\s+\d{4})\)',  # Federal Register
                 r'(\d+)\s+F\.R\.\s+(\d+)\s*\((\d{4})\)',  # Federal Register alternative
             ]
-        }
+        })
         
     async def extract_citations(self, content: str) -> List[Dict[str, Any]]:
         """Extract US Federal citations with categorization"""
+        if not contains_digit(content):
+            return []
+        
         citations = []
         
         for citation_type, patterns in self.citation_patterns.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
+                matches = pattern.finditer(content)
                 
                 for match in matches:
                     citation_data = {
@@ -102,7 +139,7 @@ class USFederalCitationExtractor(BaseCitationExtractor):
             base_confidence += 0.1
             
         # Check for year presence
-        if re.search(r'\b\d{4}\b', citation):
+        if _YEAR_PATTERN.search(citation):
             base_confidence += 0.05
             
         return min(base_confidence, 1.0)
@@ -113,14 +150,8 @@ class USFederalCitationExtractor(BaseCitationExtractor):
         normalized = citation.strip()
         
         # Standardize abbreviations
-        replacements = {
-            r'\bUS\b': 'U.S.',
-            r'\bUSC\b': 'U.S.C.',
-            r'\bCFR\b': 'C.F.R.',
-        }
-        
-        for pattern, replacement in replacements.items():
-            normalized = re.sub(pattern, replacement, normalized)
+        for pattern, replacement in _ABBREVIATION_REPLACEMENTS:
+            normalized = pattern.sub(replacement, normalized)
             
         return normalized
 
@@ -129,7 +160,7 @@ class USStateCitationExtractor(BaseCitationExtractor):
     
     def __init__(self):
         super().__init__()
-        self.state_patterns = {
+        self.state_patterns = _compile_pattern_table({
             'california': [
                 r'(\d+)\s+Cal\.(\d+)d?\s+(\d+)\s*\((\d{4})\)',     # California Reports
                 r'(\d+)\s+Cal\.App\.(\d+)d?\s+(\d+)\s*\((\d{4})\)', # California Appellate Reports
@@ -148,15 +179,18 @@ class USStateCitationExtractor(BaseCitationExtractor):
                 r'(\d+)\s+So\.(\d+)d?\s+(\d+)\s*\(Fla\.\s+(\d{4})\)', # Southern Reporter
                 r'Fla\.\s*Stat\.\s+§\s*(\d+(?:\.\d+)*)', # Florida Statutes
             ]
-        }
+        })
         
     async def extract_citations(self, content: str) -> List[Dict[str, Any]]:
         """Extract US State citations with state categorization"""
+        if not contains_digit(content):
+            return []
+        
         citations = []
         
         for state, patterns in self.state_patterns.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
+                matches = pattern.finditer(content)
                 
                 for match in matches:
                     citation_data = {
@@ -181,7 +215,7 @@ class USStateCitationExtractor(BaseCitationExtractor):
         if state in citation.lower():
             base_confidence += 0.1
             
-        if re.search(r'\b\d{4}\b', citation):  # Has year
+        if _YEAR_PATTERN.search(citation):  # Has year
             base_confidence += 0.05
             
         return min(base_confidence, 1.0)
@@ -191,7 +225,7 @@ class InternationalCitationExtractor(BaseCitationExtractor):
     
     def __init__(self):
         super().__init__()
-        self.international_patterns = {
+        self.international_patterns = _compile_pattern_table({
             'european_court_human_rights': [
                 r'([A-Z][a-zA-Z\s&\.]+)\s+v\.\s+([A-Z][a-zA-Z\s&\.]+),\s+(\d+/\d+),\s+ECHR\s+(\d{4})',
                 r'ECHR\s+(\d+),\s+(\d+/\d+)\s*\((\d{4})\)',
@@ -217,15 +251,18 @@ class InternationalCitationExtractor(BaseCitationExtractor):
                 r'\[(\d{4})\]\s+(HCA|FCAFC|FCA)\s+(\d+)',
                 r'(\d+)\s+CLR\s+(\d+)\s*\((\d{4})\)',  # Commonwealth Law Reports
             ]
-        }
+        })
         
     async def extract_citations(self, content: str) -> List[Dict[str, Any]]:
         """Extract international citations with jurisdiction identification"""
+        if not contains_digit(content):
+            return []
+        
         citations = []
         
         for jurisdiction, patterns in self.international_patterns.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
+                matches = pattern.finditer(content)
                 
                 for match in matches:
                     citation_data = {
@@ -269,7 +306,7 @@ class AcademicCitationExtractor(BaseCitationExtractor):
     
     def __init__(self):
         super().__init__()
-        self.academic_patterns = {
+        self.academic_patterns = _compile_pattern_table({
             'law_reviews': [
                 r'(\d+)\s+([A-Z][a-zA-Z\s&\.]+)\s+L\.\s*Rev\.\s+(\d+)\s*\((\d{4})\)',  # Law Review
                 r'(\d+)\s+([A-Z][a-zA-Z\s&\.]+)\s+L\.\s*J\.\s+(\d+)\s*\((\d{4})\)',    # Law Journal
@@ -284,15 +321,18 @@ class AcademicCitationExtractor(BaseCitationExtractor):
                 r'([A-Z][a-zA-Z\s\.]+),\s+([A-Z][a-zA-Z\s:]+)\s+§\s+(\d+(?:\.\d+)*)\s+\((\d+(?:st|nd|rd|th))\s+ed\.\s+(\d{4})\)',
                 r'([A-Z][a-zA-Z\s\.]+),\s+([A-Z][a-zA-Z\s:]+)\s+(\d+)\s+\((\d{4})\)',
             ]
-        }
+        })
         
     async def extract_citations(self, content: str) -> List[Dict[str, Any]]:
         """Extract academic citations with source type identification"""
+        if not contains_digit(content):
+            return []
+        
         citations = []
         
         for source_type, patterns in self.academic_patterns.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
+                matches = pattern.finditer(content)
                 
                 for match in matches:
                     citation_data = {
@@ -335,39 +375,86 @@ class BaseTopicClassifier(ABC):
         self.keywords = []
         self.phrases = []
         self.legal_terms = []
+        self._indicator_automaton = None
+        self._lowered_indicators = None
         
     @abstractmethod
     async def classify(self, content: str) -> Dict[str, Any]:
         """Classify content for this legal topic"""
         pass
         
-    def calculate_relevance_score(self, content: str) -> float:
+    def _get_indicator_automaton(self):
+        """Aho-Corasick automaton over all keywords, phrases and legal terms
+        
+        Built on first use, after the subclass has filled in its indicator lists.
+        Each value holds one (list_index, position, weight) entry per list slot the
+        term occupies, so repeated terms score exactly as the list loops do.
+        """
+        if self._indicator_automaton is None:
+            entries = {}
+            for list_index, (terms, weight) in enumerate(
+                ((self.keywords, 1.0), (self.phrases, 2.0), (self.legal_terms, 1.5))
+            ):
+                for position, term in enumerate(terms):
+                    entries.setdefault(term.lower(), []).append((list_index, position, weight))
+            
+            automaton = ahocorasick.Automaton()
+            for term_lower, term_entries in entries.items():
+                automaton.add_word(term_lower, tuple(term_entries))
+            automaton.make_automaton()
+            self._indicator_automaton = automaton
+        return self._indicator_automaton
+    
+    def _get_lowered_indicators(self) -> Tuple[List[str], List[str], List[str]]:
+        """Lowercased keywords, phrases and legal terms, computed once on first use"""
+        if self._lowered_indicators is None:
+            self._lowered_indicators = tuple(
+                [term.lower() for term in terms]
+                for terms in (self.keywords, self.phrases, self.legal_terms)
+            )
+        return self._lowered_indicators
+    
+    def calculate_relevance_score(self, content: str, content_lower: Optional[str] = None) -> float:
         """Calculate relevance score for this topic"""
-        content_lower = content.lower()
+        if content_lower is None:
+            content_lower = content.lower()
+        
+        max_possible_score = len(self.keywords) + (len(self.phrases) * 2) + (len(self.legal_terms) * 1.5)
+        if max_possible_score <= 0:
+            return 0.0
+        
+        if AHOCORASICK_AVAILABLE:
+            # Single linear pass over the content for every indicator at once;
+            # each indicator still counts once no matter how often it occurs
+            matched = set()
+            for _, term_entries in self._get_indicator_automaton().iter(content_lower):
+                matched.update(term_entries)
+            return sum(weight for _, _, weight in matched) / max_possible_score
+        
         score = 0.0
         total_indicators = 0
+        keywords, phrases, legal_terms = self._get_lowered_indicators()
         
         # Keyword matching
-        for keyword in self.keywords:
-            if keyword.lower() in content_lower:
+        for keyword in keywords:
+            if keyword in content_lower:
                 score += 1.0
                 total_indicators += 1
         
         # Phrase matching  
-        for phrase in self.phrases:
-            if phrase.lower() in content_lower:
+        for phrase in phrases:
+            if phrase in content_lower:
                 score += 2.0  # Phrases are more indicative
                 total_indicators += 1
         
         # Legal term matching
-        for term in self.legal_terms:
-            if term.lower() in content_lower:
+        for term in legal_terms:
+            if term in content_lower:
                 score += 1.5
                 total_indicators += 1
         
         # Normalize score
-        max_possible_score = len(self.keywords) + (len(self.phrases) * 2) + (len(self.legal_terms) * 1.5)
-        return score / max_possible_score if max_possible_score > 0 else 0.0
+        return score / max_possible_score
 
 class ConstitutionalLawClassifier(BaseTopicClassifier):
     """Classify Constitutional Law documents"""
@@ -392,18 +479,19 @@ class ConstitutionalLawClassifier(BaseTopicClassifier):
         
     async def classify(self, content: str) -> Dict[str, Any]:
         """Classify constitutional law content"""
-        relevance_score = self.calculate_relevance_score(content)
+        content_lower = content.lower()  # Lowercase once and reuse for every scan
+        relevance_score = self.calculate_relevance_score(content, content_lower)
         
         # Detect specific constitutional areas
         constitutional_areas = []
         
-        if any(term in content.lower() for term in ["first amendment", "free speech", "religion"]):
+        if any(term in content_lower for term in ["first amendment", "free speech", "religion"]):
             constitutional_areas.append("First Amendment")
-        if any(term in content.lower() for term in ["fourteenth amendment", "equal protection", "due process"]):
+        if any(term in content_lower for term in ["fourteenth amendment", "equal protection", "due process"]):
             constitutional_areas.append("Fourteenth Amendment")
-        if any(term in content.lower() for term in ["commerce clause", "interstate commerce"]):
+        if any(term in content_lower for term in ["commerce clause", "interstate commerce"]):
             constitutional_areas.append("Commerce Clause")
-        if any(term in content.lower() for term in ["fourth amendment", "search", "seizure"]):
+        if any(term in content_lower for term in ["fourth amendment", "search", "seizure"]):
             constitutional_areas.append("Fourth Amendment")
             
         return {
@@ -436,18 +524,19 @@ class CorporateLawClassifier(BaseTopicClassifier):
         
     async def classify(self, content: str) -> Dict[str, Any]:
         """Classify corporate law content"""
-        relevance_score = self.calculate_relevance_score(content)
+        content_lower = content.lower()
+        relevance_score = self.calculate_relevance_score(content, content_lower)
         
         # Detect specific corporate law areas
         corporate_areas = []
         
-        if any(term in content.lower() for term in ["merger", "acquisition", "m&a"]):
+        if any(term in content_lower for term in ["merger", "acquisition", "m&a"]):
             corporate_areas.append("Mergers & Acquisitions")
-        if any(term in content.lower() for term in ["securities", "sec", "insider trading"]):
+        if any(term in content_lower for term in ["securities", "sec", "insider trading"]):
             corporate_areas.append("Securities Law")
-        if any(term in content.lower() for term in ["fiduciary", "duty", "business judgment"]):
+        if any(term in content_lower for term in ["fiduciary", "duty", "business judgment"]):
             corporate_areas.append("Corporate Governance")
-        if any(term in content.lower() for term in ["bankruptcy", "reorganization", "chapter 11"]):
+        if any(term in content_lower for term in ["bankruptcy", "reorganization", "chapter 11"]):
             corporate_areas.append("Corporate Bankruptcy")
             
         return {
@@ -480,18 +569,19 @@ class CriminalLawClassifier(BaseTopicClassifier):
         
     async def classify(self, content: str) -> Dict[str, Any]:
         """Classify criminal law content"""
-        relevance_score = self.calculate_relevance_score(content)
+        content_lower = content.lower()
+        relevance_score = self.calculate_relevance_score(content, content_lower)
         
         # Detect specific criminal law areas
         criminal_areas = []
         
-        if any(term in content.lower() for term in ["murder", "homicide", "manslaughter"]):
+        if any(term in content_lower for term in ["murder", "homicide", "manslaughter"]):
             criminal_areas.append("Homicide")
-        if any(term in content.lower() for term in ["theft", "robbery", "burglary", "larceny"]):
+        if any(term in content_lower for term in ["theft", "robbery", "burglary", "larceny"]):
             criminal_areas.append("Property Crimes")
-        if any(term in content.lower() for term in ["drug", "narcotic", "controlled substance"]):
+        if any(term in content_lower for term in ["drug", "narcotic", "controlled substance"]):
             criminal_areas.append("Drug Crimes")
-        if any(term in content.lower() for term in ["fraud", "embezzlement", "white collar"]):
+        if any(term in content_lower for term in ["fraud", "embezzlement", "white collar"]):
             criminal_areas.append("White Collar Crime")
             
         return {
@@ -524,18 +614,19 @@ class InternationalLawClassifier(BaseTopicClassifier):
         
     async def classify(self, content: str) -> Dict[str, Any]:
         """Classify international law content"""
-        relevance_score = self.calculate_relevance_score(content)
+        content_lower = content.lower()
+        relevance_score = self.calculate_relevance_score(content, content_lower)
         
         # Detect specific international law areas
         international_areas = []
         
-        if any(term in content.lower() for term in ["human rights", "echr", "universal declaration"]):
+        if any(term in content_lower for term in ["human rights", "echr", "universal declaration"]):
             international_areas.append("Human Rights Law")
-        if any(term in content.lower() for term in ["trade", "wto", "nafta", "gatt"]):
+        if any(term in content_lower for term in ["trade", "wto", "nafta", "gatt"]):
             international_areas.append("International Trade Law")
-        if any(term in content.lower() for term in ["war", "conflict", "geneva", "humanitarian"]):
+        if any(term in content_lower for term in ["war", "conflict", "geneva", "humanitarian"]):
             international_areas.append("International Humanitarian Law")
-        if any(term in content.lower() for term in ["investment", "arbitration", "icsid"]):
+        if any(term in content_lower for term in ["investment", "arbitration", "icsid"]):
             international_areas.append("International Investment Law")
             
         return {
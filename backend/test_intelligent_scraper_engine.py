@@ -0,0 +1,445 @@
+"""
+Tests for the static-HTTP scraping path of IntelligentScrapingEngine
+Streaming selection, document/markup caches and adaptive browser fallback
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import aiohttp
+import pytest
+
+import intelligent_scraper_engine
+from intelligent_scraper_engine import (
+    IntelligentScrapingEngine, ScrapingResult, _iter_body_blocks, _iter_feed_items, _stream_select
+)
+
+LANDING_PAGE = """
+<html><body>
+  <div class="nav"><a href="/about">About</a></div>
+  <ul class="cases">
+    <li><a href="/case/1">Case one</a></li>
+    <li><a href="/case/2">Case two</a></li>
+  </ul>
+</body></html>
+"""
+
+CASE_PAGE = """
+<html><body>
+  <h1>Smith v. Jones</h1>
+  <script>var tracking = "not content";</script>
+  <div class="content">The appeal is dismissed.<style>.content { margin: 0 }</style></div>
+  <div class="court">Court of Appeal</div>
+</body></html>
+"""
+
+RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+  <channel>
+    <title>Court Opinions</title>
+    <item>
+      <title>Smith v. Jones</title>
+      <link>https://example.org/case/1</link>
+      <pubDate>Mon, 05 Oct 2026 10:00:00 GMT</pubDate>
+      <description>Short summary</description>
+      <content:encoded><![CDATA[<p>The appeal is <b>dismissed</b>.</p>]]></content:encoded>
+    </item>
+    <item>
+      <title>Doe v. Roe</title>
+      <link>https://example.org/case/2</link>
+      <description>&lt;p&gt;Judgment &lt;em&gt;reversed&lt;/em&gt; on appeal.&lt;/p&gt;</description>
+    </item>
+    <item></item>
+  </channel>
+</rss>
+"""
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Legal News</title>
+  <entry>
+    <title>New filing rules</title>
+    <link rel="alternate" href="https://example.org/news/rules"/>
+    <updated>2026-10-05T10:00:00Z</updated>
+    <summary>Filing deadlines change next year.</summary>
+  </entry>
+</feed>
+"""
+
+def make_pdf(page_texts: List[str]) -> bytes:
+    """Minimal uncompressed PDF with one line of Helvetica text per page"""
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    }
+    kids = []
+    for index, text in enumerate(page_texts):
+        page_id = 4 + 2 * index
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode('latin-1')
+        objects[page_id] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 3 0 R >> >> >>" % (page_id + 1)
+        )
+        objects[page_id + 1] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        kids.append(b"%d 0 R" % page_id)
+    objects[2] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+    
+    pdf, offsets = b"%PDF-1.4\n", []
+    for object_id in sorted(objects):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (object_id, objects[object_id])
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(offsets) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(offsets) + 1, xref_offset)
+    return pdf
+
+class FakeResponse:
+    """Just enough of aiohttp.ClientResponse for the HTTP scraping path"""
+
+    def __init__(self, body, status: int = 200, content_type: str = 'text/html'):
+        self.body = body
+        self.status = status
+        self.content_type = content_type
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(None, (), status=self.status)
+
+    async def text(self):
+        return self.body
+
+    async def read(self):
+        return self.body if isinstance(self.body, bytes) else self.body.encode('utf-8')
+
+class FakeSession:
+    """Serves canned pages by URL and records every request"""
+
+    def __init__(self, pages: Dict[str, FakeResponse]):
+        self.pages = pages
+        self.requested = []
+
+    def get(self, url):
+        self.requested.append(url)
+        if url not in self.pages:
+            raise aiohttp.ClientConnectionError(f"Cannot connect to {url}")
+        return self.pages[url]
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = IntelligentScrapingEngine()
+
+    async def no_delay(source_id):
+        return None
+
+    monkeypatch.setattr(engine, 'adaptive_rate_limiting', no_delay)
+    yield engine
+    if engine._pdf_pool is not None:
+        engine._pdf_pool.shutdown()
+
+class TestStreamingSelection:
+    """_iter_body_blocks and _stream_select on large pages"""
+
+    def test_body_blocks_are_top_level_and_script_free(self):
+        blocks = [
+            (block.tag, ' '.join(''.join(block.itertext()).split()))
+            for block in _iter_body_blocks(CASE_PAGE)
+        ]
+        assert blocks == [
+            ('h1', 'Smith v. Jones'),
+            ('div', 'The appeal is dismissed.'),
+            ('div', 'Court of Appeal')
+        ]
+
+    def test_stream_select_respects_limit_and_order(self):
+        markup = "<html><body>" + "".join(
+            f'<p><a href="/case/{i}">{i}</a></p>' for i in range(10)
+        ) + "</body></html>"
+        matches = _stream_select(markup, ['a[href*="case"]', '.missing'], 3, lambda element: element.get('href'))
+        assert matches == {'a[href*="case"]': ['/case/0', '/case/1', '/case/2'], '.missing': []}
+
+    def test_stream_select_skips_invalid_selectors(self):
+        matches = _stream_select(LANDING_PAGE, ['a[', 'a'], 10, lambda element: element.get('href'))
+        assert matches['a['] == []
+        assert matches['a'] == ['/about', '/case/1', '/case/2']
+
+    def test_streaming_fields_match_full_parse(self, engine):
+        field_selectors = engine.resolve_field_selectors({})
+        page = engine._parse_static_page(CASE_PAGE)
+        full_parse = {
+            field: engine._select_first_text(page, selectors)
+            for field, selectors in field_selectors.items()
+        }
+        assert engine._extract_fields_streaming(CASE_PAGE, field_selectors) == full_parse
+        assert full_parse['content'] == 'The appeal is dismissed.'
+
+class TestStaticDocumentFetch:
+    """_fetch_static_document with the URL and markup caches"""
+
+    @pytest.mark.asyncio
+    async def test_identical_markup_is_parsed_once(self, engine, monkeypatch):
+        engine.session = FakeSession({
+            'https://example.org/case/1': FakeResponse(CASE_PAGE),
+            'https://example.org/case/1-mirror': FakeResponse(CASE_PAGE)
+        })
+        parses = []
+        parse_static_page = engine._parse_static_page
+        monkeypatch.setattr(engine, '_parse_static_page', lambda markup: parses.append(markup) or parse_static_page(markup))
+        field_selectors = engine.resolve_field_selectors({})
+
+        first = await engine._fetch_static_document('https://example.org/case/1', field_selectors)
+        mirror = await engine._fetch_static_document('https://example.org/case/1-mirror', field_selectors)
+
+        assert len(parses) == 1
+        assert first['title'] == mirror['title'] == 'Smith v. Jones'
+        assert first['url'] == 'https://example.org/case/1'
+        assert mirror['url'] == 'https://example.org/case/1-mirror'
+
+    @pytest.mark.asyncio
+    async def test_markup_cache_is_keyed_by_selectors(self, engine):
+        engine.session = FakeSession({'https://example.org/case/1': FakeResponse(CASE_PAGE)})
+
+        default = await engine._fetch_static_document(
+            'https://example.org/case/1', engine.resolve_field_selectors({})
+        )
+        custom = await engine._fetch_static_document(
+            'https://example.org/case/1', engine.resolve_field_selectors({'selectors': {'content': '.court'}})
+        )
+
+        assert default['content'] == 'The appeal is dismissed.'
+        assert custom['content'] == 'Court of Appeal'
+        assert len(engine._markup_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_documents_are_copies(self, engine):
+        engine.session = FakeSession({'https://example.org/case/1': FakeResponse(CASE_PAGE)})
+        await engine._fetch_static_document('https://example.org/case/1', engine.resolve_field_selectors({}))
+
+        cached = engine._cached_document('https://example.org/case/1')
+        cached['content'] = 'edited'
+
+        assert engine._cached_document('https://example.org/case/1')['content'] == 'The appeal is dismissed.'
+        assert engine._cached_document('https://example.org/case/2') is None
+
+    def test_document_cache_evicts_oldest(self, engine, monkeypatch):
+        monkeypatch.setattr('intelligent_scraper_engine.DOCUMENT_CACHE_SIZE', 2)
+        for url in ('a', 'b', 'c'):
+            engine._remember_document(engine._document_cache, url, {'content': url})
+        assert list(engine._document_cache) == ['b', 'c']
+
+class TestHttpScraping:
+    """scrape_web_source_http and the adaptive HTTP-first fallback"""
+
+    SOURCE_CONFIG = {'base_url': 'https://example.org/'}
+
+    @pytest.mark.asyncio
+    async def test_http_scrape_follows_document_links(self, engine):
+        engine.session = FakeSession({
+            'https://example.org/': FakeResponse(LANDING_PAGE),
+            'https://example.org/case/1': FakeResponse(CASE_PAGE),
+            'https://example.org/case/2': FakeResponse('<html><body><p>Nothing here</p></body></html>')
+        })
+
+        result = await engine.scrape_web_source_http('test_source', self.SOURCE_CONFIG)
+
+        assert result.success
+        assert [doc['url'] for doc in result.documents] == ['https://example.org/case/1']
+        assert result.errors == ['No content extracted from: https://example.org/case/2']
+        assert result.metadata['links_processed'] == 2
+        assert result.metadata['landing_fetched']
+
+    @pytest.mark.asyncio
+    async def test_http_scrape_reports_unreachable_landing_page(self, engine):
+        engine.session = FakeSession({})
+
+        result = await engine.scrape_web_source_http('test_source', self.SOURCE_CONFIG)
+
+        assert not result.success
+        assert result.errors[0].startswith('Fatal error in HTTP scraping')
+        assert not result.metadata['landing_fetched']
+
+    @pytest.fixture
+    def selenium_calls(self, engine, monkeypatch):
+        calls = []
+
+        async def scrape_web_source(source_id, source_config):
+            calls.append(source_id)
+            return ScrapingResult(True, [], [], source_id, 0.0, 0, {'method': 'selenium'})
+
+        monkeypatch.setattr(engine, 'scrape_web_source', scrape_web_source)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_adaptive_pins_domain_when_pages_render_empty(self, engine, selenium_calls):
+        engine.session = FakeSession({'https://example.org/': FakeResponse(LANDING_PAGE)})
+
+        await engine.scrape_web_source_adaptive('test_source', self.SOURCE_CONFIG)
+
+        assert selenium_calls == ['test_source']
+        assert engine.browser_required_domains == {'example.org'}
+
+        # Later sources on the domain skip the HTTP pass
+        await engine.scrape_web_source_adaptive('test_source', self.SOURCE_CONFIG)
+        assert engine.session.requested.count('https://example.org/') == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('landing', [None, FakeResponse('Service Unavailable', status=503)])
+    async def test_adaptive_does_not_pin_after_fetch_failure(self, engine, selenium_calls, landing):
+        engine.session = FakeSession({} if landing is None else {'https://example.org/': landing})
+
+        await engine.scrape_web_source_adaptive('test_source', self.SOURCE_CONFIG)
+
+        assert selenium_calls == ['test_source']
+        assert engine.browser_required_domains == set()
+
+    @pytest.mark.asyncio
+    async def test_adaptive_returns_http_result_on_success(self, engine, selenium_calls):
+        engine.session = FakeSession({
+            'https://example.org/': FakeResponse(LANDING_PAGE),
+            'https://example.org/case/1': FakeResponse(CASE_PAGE)
+        })
+
+        result = await engine.scrape_web_source_adaptive('test_source', self.SOURCE_CONFIG)
+
+        assert result.metadata['method'] == 'http'
+        assert selenium_calls == []
+
+class TestFeedParsing:
+    """_iter_feed_items and scrape_rss_source"""
+
+    def test_rss_items_prefer_encoded_content(self):
+        first, second, empty = _iter_feed_items(RSS_FEED)
+
+        assert first == {
+            'title': 'Smith v. Jones',
+            'content': 'The appeal is dismissed.',
+            'court': None,
+            'date_text': 'Mon, 05 Oct 2026 10:00:00 GMT',
+            'url': 'https://example.org/case/1'
+        }
+        assert second['content'] == 'Judgment reversed on appeal.'
+        assert second['url'] == 'https://example.org/case/2'
+        assert empty == {'title': None, 'content': None, 'court': None, 'date_text': None, 'url': None}
+
+    def test_atom_entries_use_link_href(self):
+        (entry,) = _iter_feed_items(ATOM_FEED)
+
+        assert entry['title'] == 'New filing rules'
+        assert entry['content'] == 'Filing deadlines change next year.'
+        assert entry['date_text'] == '2026-10-05T10:00:00Z'
+        assert entry['url'] == 'https://example.org/news/rules'
+
+    @pytest.mark.asyncio
+    async def test_rss_scrape_skips_empty_items(self, engine):
+        engine.session = FakeSession({'https://example.org/feed': FakeResponse(RSS_FEED.decode('utf-8'))})
+
+        result = await engine.scrape_rss_source('test_source', {'base_url': 'https://example.org/feed'})
+
+        assert result.success
+        assert [doc['title'] for doc in result.documents] == ['Smith v. Jones', 'Doe v. Roe']
+        assert result.metadata == {'feeds_processed': 1, 'method': 'rss'}
+
+    @pytest.mark.asyncio
+    async def test_rss_scrape_caps_documents_across_feeds(self, engine):
+        items = ''.join(f'<item><title>Case {i}</title></item>' for i in range(80))
+        feed = f'<rss version="2.0"><channel>{items}</channel></rss>'
+        engine.session = FakeSession({
+            'https://example.org/feed/a': FakeResponse(feed),
+            'https://example.org/feed/b': FakeResponse(feed),
+            'https://example.org/feed/c': FakeResponse(feed)
+        })
+
+        result = await engine.scrape_rss_source('test_source', {
+            'base_url': 'https://example.org/',
+            'rss_feeds': ['https://example.org/feed/a', 'https://example.org/feed/b', 'https://example.org/feed/c']
+        })
+
+        assert result.documents_found == 100
+        assert result.documents[-1]['title'] == 'Case 19'
+        assert 'https://example.org/feed/c' not in engine.session.requested
+
+    @pytest.mark.asyncio
+    async def test_rss_scrape_records_failed_feeds(self, engine):
+        engine.session = FakeSession({'https://example.org/feed/b': FakeResponse(RSS_FEED.decode('utf-8'))})
+
+        result = await engine.scrape_rss_source('test_source', {
+            'base_url': 'https://example.org/',
+            'rss_feeds': ['https://example.org/feed/a', 'https://example.org/feed/b']
+        })
+
+        assert result.documents_found == 2
+        assert result.errors[0].startswith('Error processing feed https://example.org/feed/a')
+
+class TestPdfExtraction:
+    """extract_pdf_content and the PDF path of _fetch_static_document"""
+
+    @pytest.mark.asyncio
+    async def test_pdf_documents_are_extracted_in_process_pool(self, engine):
+        engine.session = FakeSession({
+            'https://example.org/opinion.pdf': FakeResponse(make_pdf(['Opinion of the court']), content_type='application/pdf')
+        })
+
+        doc_data = await engine._fetch_static_document('https://example.org/opinion.pdf', engine.resolve_field_selectors({}))
+
+        assert doc_data['content'] == 'Opinion of the court'
+        assert doc_data['title'] is None
+        assert doc_data['url'] == 'https://example.org/opinion.pdf'
+
+    @pytest.fixture
+    def page_ranges(self, engine, monkeypatch):
+        """Record the page range of every extraction task (run on threads so calls are visible)"""
+        ranges = []
+        pdf_extract_sync = intelligent_scraper_engine._pdf_extract_sync
+
+        def record_range(pdf_bytes, start=0, end=None):
+            ranges.append((start, end))
+            return pdf_extract_sync(pdf_bytes, start, end)
+
+        monkeypatch.setattr(intelligent_scraper_engine, '_pdf_extract_sync', record_range)
+        engine._pdf_pool = ThreadPoolExecutor(max_workers=4)
+        return ranges
+
+    @pytest.mark.asyncio
+    async def test_long_pdfs_are_split_by_page_range(self, engine, page_ranges):
+        pages = [f'Page {number}' for number in range(40)]
+
+        text = await engine.extract_pdf_content(make_pdf(pages))
+
+        assert text.split('\n') == pages
+        assert sorted(page_ranges) == [(0, 16), (16, 32), (32, 40)]
+
+    @pytest.mark.asyncio
+    async def test_short_pdfs_are_extracted_in_one_task(self, engine, page_ranges):
+        pages = [f'Page {number}' for number in range(intelligent_scraper_engine.PDF_PARALLEL_MIN_PAGES - 1)]
+
+        text = await engine.extract_pdf_content(make_pdf(pages))
+
+        assert text.split('\n') == pages
+        assert page_ranges == [(0, None)]
+
+    @pytest.mark.parametrize('pdfium_available', [True, False])
+    def test_pdfium_and_pdfplumber_extract_the_same_pages(self, monkeypatch, pdfium_available):
+        if pdfium_available:
+            pytest.importorskip('pypdfium2')
+        else:
+            pytest.importorskip('pdfplumber')
+        monkeypatch.setattr(intelligent_scraper_engine, 'PYPDFIUM2_AVAILABLE', pdfium_available)
+        pdf_bytes = make_pdf(['First page', 'Second page', 'Third page'])
+
+        assert intelligent_scraper_engine._pdf_page_count(pdf_bytes) == 3
+        assert intelligent_scraper_engine._pdf_extract_sync(pdf_bytes) == 'First page\nSecond page\nThird page'
+        assert intelligent_scraper_engine._pdf_extract_sync(pdf_bytes, 1, 3) == 'Second page\nThird page'
+
+    @pytest.mark.asyncio
+    async def test_pdfs_are_skipped_without_a_pdf_library(self, engine, monkeypatch):
+        monkeypatch.setattr(intelligent_scraper_engine, 'PYPDFIUM2_AVAILABLE', False)
+        monkeypatch.setattr(intelligent_scraper_engine, 'PDFPLUMBER_AVAILABLE', False)
+
+        assert await engine.extract_pdf_content(make_pdf(['Unread'])) is None
+        assert engine._pdf_pool is None
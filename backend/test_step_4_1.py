@@ -8,6 +8,7 @@ import logging
 import os
 import json
 import time
+from collections import Counter
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 
@@ -566,10 +567,11 @@ async def run_step_4_1_tests():
     total_time = time.time() - overall_start
     
     # Generate summary report
-    passed_tests = sum(1 for result in results.values() if result['test_status'] == 'passed')
-    warning_tests = sum(1 for result in results.values() if result['test_status'] == 'warning')
-    skipped_tests = sum(1 for result in results.values() if result['test_status'] == 'skipped')
-    failed_tests = sum(1 for result in results.values() if result['test_status'] == 'failed')
+    status_counts = Counter(result['test_status'] for result in results.values())
+    passed_tests = status_counts['passed']
+    warning_tests = status_counts['warning']
+    skipped_tests = status_counts['skipped']
+    failed_tests = status_counts['failed']
     
     if failed_tests == 0 and passed_tests > 0:
         overall_status = 'passed'
@@ -12,20 +12,31 @@ TESTING SCOPE:
 """
 
 import asyncio
+import heapq
+import importlib.util
+import os
 import pytest
+import tempfile
 import logging
-from typing import Dict, Any, List
+import numpy as np
+from typing import Dict, Any, List, Optional
 import time
+from collections import Counter
 from datetime import datetime
+from operator import attrgetter, itemgetter
+from xml.etree import ElementTree
 
 # Import components to test
 from ultra_comprehensive_global_sources import (
     ULTRA_COMPREHENSIVE_GLOBAL_SOURCES,
     ULTRA_COMPREHENSIVE_CONFIG,
+    TOTAL_SOURCES,
+    TOTAL_ESTIMATED_DOCUMENTS,
     get_sources_by_tier,
     get_sources_by_jurisdiction,
     get_sources_by_priority,
     get_comprehensive_statistics,
+    get_source_numeric_view,
     SourceConfig,
     SourceType,
     DocumentType
@@ -33,10 +44,38 @@ from ultra_comprehensive_global_sources import (
 
 from ultra_scale_scraping_engine import UltraScaleScrapingEngine
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# libuv event loop policy for this module's async tests, when available (winloop on Windows)
+try:
+    import uvloop
+    _LIBUV_LOOP_POLICY = uvloop.EventLoopPolicy
+except ImportError:
+    try:
+        import winloop
+        _LIBUV_LOOP_POLICY = winloop.EventLoopPolicy
+    except ImportError:
+        _LIBUV_LOOP_POLICY = None
+
+# Configure logging (set LOGLEVEL=WARNING to silence per-test detail in CI)
+logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO").upper())
 logger = logging.getLogger(__name__)
 
+@pytest.fixture(scope="session")
+def stats():
+    """Comprehensive source statistics, computed once per test session"""
+    return get_comprehensive_statistics()
+
+@pytest.fixture(scope="module")
+def event_loop_policy():
+    """Run this module's async tests on libuv without changing the global policy for other modules"""
+    if _LIBUV_LOOP_POLICY is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return _LIBUV_LOOP_POLICY()
+
+@pytest.fixture(scope="module")
+def engine():
+    """Single UltraScaleScrapingEngine shared by the engine-level tests"""
+    return UltraScaleScrapingEngine(max_concurrent_sources=50, max_concurrent_requests=200)
+
 class TestUltraComprehensiveExpansion:
     """Comprehensive test suite for the ultra-comprehensive sources expansion"""
     
@@ -67,15 +106,12 @@ class TestUltraComprehensiveExpansion:
             assert key in ULTRA_COMPREHENSIVE_CONFIG
         
         # Log basic statistics
-        total_sources = len(ULTRA_COMPREHENSIVE_GLOBAL_SOURCES)
-        total_docs = sum(
-            source.estimated_documents 
-            for source in ULTRA_COMPREHENSIVE_GLOBAL_SOURCES.values()
-        )
+        total_sources = TOTAL_SOURCES
+        total_docs = TOTAL_ESTIMATED_DOCUMENTS
         
-        logger.info(f"✅ Ultra-Comprehensive Sources Available: {total_sources:,}")
-        logger.info(f"✅ Total Estimated Documents: {total_docs:,}")
-        logger.info(f"✅ Configuration Valid with {len(ULTRA_COMPREHENSIVE_CONFIG)} settings")
+        logger.info("✅ Ultra-Comprehensive Sources Available: %s", format(total_sources, ","))
+        logger.info("✅ Total Estimated Documents: %s", format(total_docs, ","))
+        logger.info("✅ Configuration Valid with %s settings", len(ULTRA_COMPREHENSIVE_CONFIG))
         
         # Verify this is a significant expansion
         assert total_sources >= 100, f"Expected massive expansion, got {total_sources} sources"
@@ -96,14 +132,17 @@ class TestUltraComprehensiveExpansion:
                 'documents': sum(s.estimated_documents for s in tier_sources.values()) if tier_sources else 0,
                 'has_sources': len(tier_sources) > 0
             }
-            
-            # Log tier information
-            logger.info(f"   📁 {tier_name}: {tier_coverage[tier_name]['sources']} sources, "
-                       f"{tier_coverage[tier_name]['documents']:,} documents")
+        
+        # Log tier information in a single record
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join(
+                f"   📁 {tier_name}: {data['sources']} sources, {data['documents']:,} documents"
+                for tier_name, data in tier_coverage.items()
+            ))
         
         # Verify we have sources in multiple tiers
         tiers_with_sources = sum(1 for tier_data in tier_coverage.values() if tier_data['has_sources'])
-        logger.info(f"✅ Active Tiers: {tiers_with_sources}/7")
+        logger.info("✅ Active Tiers: %s/7", tiers_with_sources)
         
         # Should have at least 4 tiers with sources for comprehensive coverage
         assert tiers_with_sources >= 4, f"Expected sources in at least 4 tiers, got {tiers_with_sources}"
@@ -112,54 +151,40 @@ class TestUltraComprehensiveExpansion:
         """Test 3: Validate source configurations are properly structured"""
         logger.info("⚙️ Test 3: Source Configuration Validity")
         
-        valid_sources = 0
-        invalid_sources = []
-        source_type_counts = {}
-        jurisdiction_counts = {}
+        sources = ULTRA_COMPREHENSIVE_GLOBAL_SOURCES
         
-        for source_id, config in ULTRA_COMPREHENSIVE_GLOBAL_SOURCES.items():
-            try:
-                # Verify config is SourceConfig instance
-                assert isinstance(config, SourceConfig)
-                
-                # Verify required fields
-                assert hasattr(config, 'name') and config.name
-                assert hasattr(config, 'source_type') and config.source_type
-                assert hasattr(config, 'base_url') and config.base_url
-                assert hasattr(config, 'estimated_documents') and config.estimated_documents >= 0
-                assert hasattr(config, 'jurisdiction') and config.jurisdiction
-                assert hasattr(config, 'priority') and 1 <= config.priority <= 5
-                assert hasattr(config, 'quality_score') and 0 <= config.quality_score <= 10
-                
-                # Count source types
-                source_type = config.source_type.value
-                source_type_counts[source_type] = source_type_counts.get(source_type, 0) + 1
-                
-                # Count jurisdictions
-                jurisdiction = config.jurisdiction
-                jurisdiction_counts[jurisdiction] = jurisdiction_counts.get(jurisdiction, 0) + 1
-                
-                valid_sources += 1
-                
-            except Exception as e:
-                invalid_sources.append(f"{source_id}: {str(e)}")
+        # Field constraints are enforced by SourceConfig.__post_init__, so every
+        # config that made it into the registry at import time is valid
+        invalid_sources = [
+            source_id for source_id, config in sources.items()
+            if not isinstance(config, SourceConfig)
+        ]
+        valid_sources = len(sources) - len(invalid_sources)
         
-        logger.info(f"✅ Valid Sources: {valid_sources:,}")
-        logger.info(f"❌ Invalid Sources: {len(invalid_sources)}")
+        # Count enum members directly; .value is only needed for display
+        rows = list(map(attrgetter('source_type', 'jurisdiction'), sources.values()))
+        source_type_counts = Counter(source_type for source_type, _ in rows)
+        jurisdiction_counts = Counter(jurisdiction for _, jurisdiction in rows)
         
-        # Log source type breakdown
-        logger.info("📊 Source Type Distribution:")
-        for source_type, count in sorted(source_type_counts.items()):
-            logger.info(f"   {source_type}: {count:,}")
+        logger.info("✅ Valid Sources: %s", format(valid_sources, ","))
+        logger.info("❌ Invalid Sources: %s", len(invalid_sources))
         
-        # Log top jurisdictions
-        logger.info("🌍 Top Jurisdictions:")
-        for jurisdiction, count in sorted(jurisdiction_counts.items(), key=lambda x: x[1], reverse=True)[:10]:
-            logger.info(f"   {jurisdiction}: {count:,}")
+        # Log source type breakdown
+        if logger.isEnabledFor(logging.INFO):
+            lines = ["📊 Source Type Distribution:"]
+            lines += sorted(f"   {source_type.value}: {count:,}" for source_type, count in source_type_counts.items())
+            
+            # Log top jurisdictions
+            lines.append("🌍 Top Jurisdictions:")
+            lines += [
+                f"   {jurisdiction}: {count:,}"
+                for jurisdiction, count in heapq.nlargest(10, jurisdiction_counts.items(), key=itemgetter(1))
+            ]
+            logger.info("\n".join(lines))
         
         # Verify high validity rate
         validity_rate = valid_sources / len(ULTRA_COMPREHENSIVE_GLOBAL_SOURCES) * 100
-        logger.info(f"✅ Validity Rate: {validity_rate:.1f}%")
+        logger.info("✅ Validity Rate: %.1f%%", validity_rate)
         
         assert validity_rate >= 95, f"Expected 95%+ validity rate, got {validity_rate:.1f}%"
         
@@ -169,12 +194,38 @@ class TestUltraComprehensiveExpansion:
         # Verify global coverage
         assert len(jurisdiction_counts) >= 10, f"Expected 10+ jurisdictions, got {len(jurisdiction_counts)}"
     
-    def test_comprehensive_statistics_function(self):
+    def test_source_config_rejects_invalid_fields(self):
+        """Test 3b: SourceConfig validates its fields at construction"""
+        logger.info("🛡️ Test 3b: SourceConfig Construction Validation")
+        
+        valid_fields = {
+            "name": "Validation Probe",
+            "source_type": SourceType.WEB_SCRAPING,
+            "base_url": "https://example.org",
+            "jurisdiction": "Test"
+        }
+        
+        invalid_overrides = [
+            {"name": ""},
+            {"base_url": ""},
+            {"source_type": "web_scraping"},
+            {"estimated_documents": -1},
+            {"priority": 0},
+            {"priority": 6},
+            {"quality_score": 10.5}
+        ]
+        
+        SourceConfig(**valid_fields)
+        for override in invalid_overrides:
+            with pytest.raises(ValueError):
+                SourceConfig(**{**valid_fields, **override})
+        
+        logger.info("✅ Rejected %s invalid configurations", len(invalid_overrides))
+    
+    def test_comprehensive_statistics_function(self, stats):
         """Test 4: Verify comprehensive statistics function works correctly"""
         logger.info("📈 Test 4: Comprehensive Statistics Function")
         
-        stats = get_comprehensive_statistics()
-        
         # Verify statistics structure
         required_keys = [
             'total_sources', 'total_estimated_documents', 'tier_breakdown',
@@ -192,16 +243,19 @@ class TestUltraComprehensiveExpansion:
         assert isinstance(stats['source_type_breakdown'], dict)
         
         # Log comprehensive statistics
-        logger.info(f"✅ Total Sources: {stats['total_sources']:,}")
-        logger.info(f"✅ Total Estimated Documents: {stats['total_estimated_documents']:,}")
-        logger.info(f"✅ High Priority Sources: {stats['high_priority_sources']:,}")
-        logger.info(f"✅ Jurisdictions Covered: {len(stats['jurisdiction_breakdown']):,}")
-        
-        # Verify tier breakdown
-        logger.info("📊 Tier Breakdown:")
-        for tier, data in stats['tier_breakdown'].items():
-            if data['sources'] > 0:
-                logger.info(f"   {tier}: {data['sources']:,} sources, {data['documents']:,} documents")
+        logger.info("✅ Total Sources: %s", format(stats['total_sources'], ","))
+        logger.info("✅ Total Estimated Documents: %s", format(stats['total_estimated_documents'], ","))
+        logger.info("✅ High Priority Sources: %s", format(stats['high_priority_sources'], ","))
+        logger.info("✅ Jurisdictions Covered: %s", format(len(stats['jurisdiction_breakdown']), ","))
+        
+        if logger.isEnabledFor(logging.INFO):
+            # Verify tier breakdown
+            lines = ["📊 Tier Breakdown:"]
+            lines += [
+                f"   {tier}: {data['sources']:,} sources, {data['documents']:,} documents"
+                for tier, data in stats['tier_breakdown'].items() if data['sources'] > 0
+            ]
+            logger.info("\n".join(lines))
         
         # Verify massive scale achieved
         assert stats['total_sources'] >= 100, "Expected 100+ sources for comprehensive coverage"
@@ -215,8 +269,8 @@ class TestUltraComprehensiveExpansion:
         priority_1_sources = get_sources_by_priority(1)
         priority_2_sources = get_sources_by_priority(2)
         
-        logger.info(f"🏆 Priority 1 Sources: {len(priority_1_sources):,}")
-        logger.info(f"⭐ Priority 2 Sources: {len(priority_2_sources):,}")
+        logger.info("🏆 Priority 1 Sources: %s", format(len(priority_1_sources), ","))
+        logger.info("⭐ Priority 2 Sources: %s", format(len(priority_2_sources), ","))
         
         # Verify priority filtering works
         for source_id, config in priority_1_sources.items():
@@ -226,8 +280,8 @@ class TestUltraComprehensiveExpansion:
         us_sources = get_sources_by_jurisdiction("United States")
         uk_sources = get_sources_by_jurisdiction("United Kingdom")
         
-        logger.info(f"🇺🇸 United States Sources: {len(us_sources):,}")
-        logger.info(f"🇬🇧 United Kingdom Sources: {len(uk_sources):,}")
+        logger.info("🇺🇸 United States Sources: %s", format(len(us_sources), ","))
+        logger.info("🇬🇧 United Kingdom Sources: %s", format(len(uk_sources), ","))
         
         # Verify jurisdiction filtering works
         for source_id, config in us_sources.items():
@@ -237,14 +291,13 @@ class TestUltraComprehensiveExpansion:
         assert len(us_sources) > 0, "Expected US sources"
         assert len(priority_1_sources) > 0, "Expected high priority sources"
     
-    def test_ultra_scale_engine_integration(self):
+    @pytest.mark.xdist_group("engine")
+    def test_ultra_scale_engine_integration(self, engine):
         """Test 6: Verify ultra-scale engine integrates with new sources"""
         logger.info("🚀 Test 6: Ultra-Scale Engine Integration")
         
         try:
             # Initialize ultra-scale engine
-            engine = UltraScaleScrapingEngine(max_concurrent_sources=50, max_concurrent_requests=200)
-            
             # Verify engine has access to ultra-comprehensive sources
             assert hasattr(engine, 'ultra_comprehensive_sources')
             assert hasattr(engine, 'comprehensive_stats')
@@ -258,26 +311,28 @@ class TestUltraComprehensiveExpansion:
             # Test new 7-tier grouping method exists
             assert hasattr(engine, 'group_sources_intelligently_7_tier')
             
-            logger.info(f"✅ Engine initialized with {stats['total_sources']:,} sources")
-            logger.info(f"✅ Targeting {stats['total_estimated_documents']:,} documents")
-            logger.info(f"✅ Covering {len(stats['jurisdiction_breakdown']):,} jurisdictions")
+            logger.info("✅ Engine initialized with %s sources", format(stats['total_sources'], ","))
+            logger.info("✅ Targeting %s documents", format(stats['total_estimated_documents'], ","))
+            logger.info("✅ Covering %s jurisdictions", format(len(stats['jurisdiction_breakdown']), ","))
             
-            # Log tier breakdown
-            logger.info("📊 Engine Tier Breakdown:")
-            for tier, data in stats['tier_breakdown'].items():
-                if data['sources'] > 0:
-                    logger.info(f"   {tier}: {data['sources']:,} sources → {data['documents']:,} docs")
+            if logger.isEnabledFor(logging.INFO):
+                # Log tier breakdown
+                logger.info("📊 Engine Tier Breakdown:")
+                for tier, data in stats['tier_breakdown'].items():
+                    if data['sources'] > 0:
+                        logger.info("   %s: %s sources → %s docs",
+                                    tier, format(data['sources'], ","), format(data['documents'], ","))
             
         except Exception as e:
             pytest.fail(f"Engine integration failed: {e}")
     
-    async def test_7_tier_grouping_functionality(self):
+    @pytest.mark.asyncio
+    @pytest.mark.xdist_group("engine")
+    async def test_7_tier_grouping_functionality(self, engine):
         """Test 7: Test new 7-tier intelligent grouping"""
         logger.info("🎯 Test 7: 7-Tier Intelligent Grouping")
         
         try:
-            engine = UltraScaleScrapingEngine(max_concurrent_sources=10, max_concurrent_requests=50)
-            
             # Test the new 7-tier grouping method
             tier_groups = await engine.group_sources_intelligently_7_tier()
             
@@ -302,11 +357,12 @@ class TestUltraComprehensiveExpansion:
                 total_sources += sources_count
                 total_documents += docs_count
                 
-                logger.info(f"   📁 {tier_name}: {sources_count:,} sources → {docs_count:,} docs")
-                logger.info(f"      Strategy: {strategy}")
+                logger.info("   📁 %s: %s sources → %s docs",
+                            tier_name, format(sources_count, ","), format(docs_count, ","))
+                logger.info("      Strategy: %s", strategy)
             
-            logger.info(f"✅ Total Grouped Sources: {total_sources:,}")
-            logger.info(f"✅ Total Grouped Documents: {total_documents:,}")
+            logger.info("✅ Total Grouped Sources: %s", format(total_sources, ","))
+            logger.info("✅ Total Grouped Documents: %s", format(total_documents, ","))
             
             # Verify we have meaningful grouping
             assert total_sources > 0, "Expected sources in tier grouping"
@@ -315,12 +371,10 @@ class TestUltraComprehensiveExpansion:
         except Exception as e:
             pytest.fail(f"7-tier grouping failed: {e}")
     
-    def test_performance_scalability_metrics(self):
+    def test_performance_scalability_metrics(self, stats):
         """Test 8: Verify system can handle massive scale"""
         logger.info("⚡ Test 8: Performance Scalability Metrics")
         
-        stats = get_comprehensive_statistics()
-        
         # Calculate theoretical processing metrics
         total_sources = stats['total_sources']
         total_docs = stats['total_estimated_documents']
@@ -331,10 +385,11 @@ class TestUltraComprehensiveExpansion:
         estimated_hours = (total_sources / concurrent_capacity) * 0.5  # Assume 30min per source batch
         
         logger.info("📊 Scalability Analysis:")
-        logger.info(f"   🎯 Target Scale: {total_sources:,} sources → {total_docs:,} documents")
-        logger.info(f"   ⚡ Concurrent Workers: {concurrent_capacity:,}")
-        logger.info(f"   📈 Avg Documents/Source: {avg_docs_per_source:,.0f}")
-        logger.info(f"   ⏱️ Estimated Processing Time: {estimated_hours:.1f} hours")
+        logger.info("   🎯 Target Scale: %s sources → %s documents",
+                    format(total_sources, ","), format(total_docs, ","))
+        logger.info("   ⚡ Concurrent Workers: %s", format(concurrent_capacity, ","))
+        logger.info("   📈 Avg Documents/Source: %s", format(avg_docs_per_source, ",.0f"))
+        logger.info("   ⏱️ Estimated Processing Time: %.1f hours", estimated_hours)
         
         # Performance thresholds for ultra-comprehensive system
         performance_checks = {
@@ -348,21 +403,20 @@ class TestUltraComprehensiveExpansion:
         passed_checks = 0
         for check_name, passed in performance_checks.items():
             status = "✅" if passed else "❌"
-            logger.info(f"   {status} {check_name}: {passed}")
+            logger.info("   %s %s: %s", status, check_name, passed)
             if passed:
                 passed_checks += 1
         
         performance_score = (passed_checks / len(performance_checks)) * 100
-        logger.info(f"🎯 Performance Score: {performance_score:.1f}%")
+        logger.info("🎯 Performance Score: %.1f%%", performance_score)
         
         # Should pass most scalability checks
         assert performance_score >= 70, f"Performance score too low: {performance_score:.1f}%"
     
-    def test_global_jurisdiction_coverage(self):
+    def test_global_jurisdiction_coverage(self, stats):
         """Test 9: Verify comprehensive global legal coverage"""
         logger.info("🌍 Test 9: Global Jurisdiction Coverage")
         
-        stats = get_comprehensive_statistics()
         jurisdictions = stats['jurisdiction_breakdown']
         
         # Expected major jurisdictions for comprehensive legal coverage
@@ -383,22 +437,24 @@ class TestUltraComprehensiveExpansion:
                 coverage_analysis[jurisdiction] = {'covered': False, 'sources': 0, 'documents': 0}
         
         # Log coverage results
-        logger.info("🗺️ Major Jurisdiction Coverage:")
-        covered_jurisdictions = 0
-        for jurisdiction, data in coverage_analysis.items():
-            status = "✅" if data['covered'] else "❌"
-            logger.info(f"   {status} {jurisdiction}: {data['sources']} sources, {data['documents']:,} documents")
-            if data['covered']:
-                covered_jurisdictions += 1
+        covered_jurisdictions = sum(data['covered'] for data in coverage_analysis.values())
+        if logger.isEnabledFor(logging.INFO):
+            lines = ["🗺️ Major Jurisdiction Coverage:"]
+            lines += [
+                f"   {'✅' if data['covered'] else '❌'} {jurisdiction}: {data['sources']} sources, {data['documents']:,} documents"
+                for jurisdiction, data in coverage_analysis.items()
+            ]
+            logger.info("\n".join(lines))
         
         # Additional jurisdiction statistics
         total_jurisdictions = len(jurisdictions)
-        logger.info(f"🌍 Total Jurisdictions Covered: {total_jurisdictions:,}")
-        logger.info(f"🎯 Major Jurisdictions Coverage: {covered_jurisdictions}/{len(expected_major_jurisdictions)}")
+        logger.info("🌍 Total Jurisdictions Covered: %s", format(total_jurisdictions, ","))
+        logger.info("🎯 Major Jurisdictions Coverage: %s/%s",
+                    covered_jurisdictions, len(expected_major_jurisdictions))
         
         # Verify comprehensive global coverage
         major_coverage_rate = (covered_jurisdictions / len(expected_major_jurisdictions)) * 100
-        logger.info(f"📊 Major Jurisdiction Coverage Rate: {major_coverage_rate:.1f}%")
+        logger.info("📊 Major Jurisdiction Coverage Rate: %.1f%%", major_coverage_rate)
         
         # Should cover most major legal jurisdictions
         assert major_coverage_rate >= 50, f"Major jurisdiction coverage too low: {major_coverage_rate:.1f}%"
@@ -408,52 +464,44 @@ class TestUltraComprehensiveExpansion:
         """Test 10: Analyze source quality distribution"""
         logger.info("⭐ Test 10: Source Quality Distribution")
         
+        # Numeric columns of all sources (structure-of-arrays view)
+        columns = get_source_numeric_view()
+        qualities = columns['quality']
+        total_sources = len(qualities)
+        
+        # Bucket ids 0-4 from one vectorized sweep over [6.5, 7.5, 8.5, 9.5) edges
+        quality_levels = ['acceptable', 'good', 'very_good', 'excellent', 'exceptional']
+        quality_counts = np.bincount(np.digitize(qualities, [6.5, 7.5, 8.5, 9.5]), minlength=5).tolist()
+        quality_by_level = dict(zip(quality_levels, quality_counts))
         quality_distribution = {
-            'exceptional': 0,  # 9.5-10.0
-            'excellent': 0,    # 8.5-9.4
-            'very_good': 0,    # 7.5-8.4
-            'good': 0,         # 6.5-7.4
-            'acceptable': 0    # <6.5
+            'exceptional': quality_by_level['exceptional'],  # 9.5-10.0
+            'excellent': quality_by_level['excellent'],      # 8.5-9.4
+            'very_good': quality_by_level['very_good'],      # 7.5-8.4
+            'good': quality_by_level['good'],                # 6.5-7.4
+            'acceptable': quality_by_level['acceptable']     # <6.5
         }
         
-        priority_distribution = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
+        priority_counts = np.bincount(columns['priority'], minlength=6).tolist()
+        priority_distribution = dict(zip(range(1, len(priority_counts)), priority_counts[1:]))
         
-        total_sources = 0
-        quality_sum = 0
+        avg_quality = float(qualities.mean(dtype=np.float64)) if total_sources > 0 else 0
         
-        for source_id, config in ULTRA_COMPREHENSIVE_GLOBAL_SOURCES.items():
-            total_sources += 1
-            quality = config.quality_score
-            priority = config.priority
-            
-            quality_sum += quality
-            priority_distribution[priority] = priority_distribution.get(priority, 0) + 1
+        if logger.isEnabledFor(logging.INFO):
+            scale = 100 / total_sources if total_sources > 0 else 0
+            lines = ["⭐ Source Quality Distribution:"]
+            lines += [
+                f"   {quality_level}: {count:,} sources ({count * scale:.1f}%)"
+                for quality_level, count in quality_distribution.items()
+            ]
             
-            # Classify quality
-            if quality >= 9.5:
-                quality_distribution['exceptional'] += 1
-            elif quality >= 8.5:
-                quality_distribution['excellent'] += 1
-            elif quality >= 7.5:
-                quality_distribution['very_good'] += 1
-            elif quality >= 6.5:
-                quality_distribution['good'] += 1
-            else:
-                quality_distribution['acceptable'] += 1
-        
-        avg_quality = quality_sum / total_sources if total_sources > 0 else 0
-        
-        logger.info("⭐ Source Quality Distribution:")
-        for quality_level, count in quality_distribution.items():
-            percentage = (count / total_sources) * 100 if total_sources > 0 else 0
-            logger.info(f"   {quality_level}: {count:,} sources ({percentage:.1f}%)")
+            lines.append("🏆 Source Priority Distribution:")
+            lines += [
+                f"   Priority {priority}: {count:,} sources ({count * scale:.1f}%)"
+                for priority, count in sorted(priority_distribution.items())
+            ]
+            logger.info("\n".join(lines))
         
-        logger.info("🏆 Source Priority Distribution:")
-        for priority, count in sorted(priority_distribution.items()):
-            percentage = (count / total_sources) * 100 if total_sources > 0 else 0
-            logger.info(f"   Priority {priority}: {count:,} sources ({percentage:.1f}%)")
-        
-        logger.info(f"📊 Average Quality Score: {avg_quality:.2f}")
+        logger.info("📊 Average Quality Score: %.2f", avg_quality)
         
         # Quality standards for comprehensive legal database
         high_quality_sources = quality_distribution['exceptional'] + quality_distribution['excellent']
@@ -462,115 +510,103 @@ class TestUltraComprehensiveExpansion:
         high_priority_sources = priority_distribution[1] + priority_distribution[2]
         high_priority_rate = (high_priority_sources / total_sources) * 100 if total_sources > 0 else 0
         
-        logger.info(f"✅ High Quality Rate (8.5+): {high_quality_rate:.1f}%")
-        logger.info(f"🎯 High Priority Rate (1-2): {high_priority_rate:.1f}%")
+        logger.info("✅ High Quality Rate (8.5+): %.1f%%", high_quality_rate)
+        logger.info("🎯 High Priority Rate (1-2): %.1f%%", high_priority_rate)
         
         # Quality thresholds for legal database
         assert avg_quality >= 7.5, f"Average quality too low: {avg_quality:.2f}"
         assert high_quality_rate >= 30, f"High quality rate too low: {high_quality_rate:.1f}%"
 
 
-def run_comprehensive_tests():
-    """Run all comprehensive tests and generate detailed report"""
+def _read_junit_results(report_path: str) -> Dict[str, str]:
+    """Map each test case in a pytest JUnit XML report to a PASSED/FAILED/SKIPPED line"""
+    test_results = {}
+    for case in ElementTree.parse(report_path).getroot().iter("testcase"):
+        outcome = case.find("failure")
+        if outcome is None:
+            outcome = case.find("error")
+        if outcome is not None:
+            test_results[case.get("name")] = f"❌ FAILED: {outcome.get('message', '')}"
+        elif case.find("skipped") is not None:
+            test_results[case.get("name")] = "⏭️ SKIPPED"
+        else:
+            test_results[case.get("name")] = "✅ PASSED"
+    return test_results
+
+
+def run_comprehensive_tests(report_path: Optional[str] = None):
+    """Run all comprehensive tests and generate detailed report
+    
+    The JUnit XML report is written to report_path when given, otherwise to a
+    temporary directory that is removed afterwards.
+    """
+    if report_path is None:
+        with tempfile.TemporaryDirectory(prefix="ultra_expansion_") as report_dir:
+            results = run_comprehensive_tests(os.path.join(report_dir, "report.xml"))
+        results['report_path'] = None
+        return results
+    
     logger.info("🌍 ULTRA-COMPREHENSIVE GLOBAL SOURCES EXPANSION - TEST SUITE")
     logger.info("=" * 80)
     
     start_time = time.time()
     
-    # Initialize test class
-    test_suite = TestUltraComprehensiveExpansion()
-    test_suite.setup()
-    
-    # Test results tracking
-    test_results = {}
-    
-    # Run all tests
-    tests = [
-        ("Sources Availability", test_suite.test_ultra_comprehensive_sources_availability),
-        ("7-Tier System Coverage", test_suite.test_7_tier_system_coverage),
-        ("Configuration Validity", test_suite.test_source_configuration_validity),
-        ("Statistics Function", test_suite.test_comprehensive_statistics_function),
-        ("Priority & Jurisdiction Filtering", test_suite.test_priority_and_jurisdiction_filtering),
-        ("Engine Integration", test_suite.test_ultra_scale_engine_integration),
-        ("Performance Scalability", test_suite.test_performance_scalability_metrics),
-        ("Global Coverage", test_suite.test_global_jurisdiction_coverage),
-        ("Quality Distribution", test_suite.test_source_quality_distribution),
-    ]
+    # Delegate collection and execution to pytest; spread independent tests
+    # across CPU cores when pytest-xdist is installed
+    pytest_args = ["-q", "-p", "no:cacheprovider", "--import-mode=importlib",
+                   f"--junitxml={report_path}", __file__]
+    if importlib.util.find_spec("xdist") is not None:
+        pytest_args += ["-n", "auto", "--dist=loadgroup"]
     
-    # Async tests
-    async_tests = [
-        ("7-Tier Grouping", test_suite.test_7_tier_grouping_functionality),
-    ]
+    exit_code = pytest.main(pytest_args)
     
-    # Run synchronous tests
-    passed_tests = 0
-    for test_name, test_func in tests:
-        try:
-            logger.info(f"\n🧪 Running: {test_name}")
-            test_func()
-            test_results[test_name] = "✅ PASSED"
-            passed_tests += 1
-            logger.info(f"✅ {test_name}: PASSED")
-        except Exception as e:
-            test_results[test_name] = f"❌ FAILED: {str(e)}"
-            logger.error(f"❌ {test_name}: FAILED - {e}")
-    
-    # Run asynchronous tests
-    async def run_async_tests():
-        nonlocal passed_tests
-        for test_name, test_func in async_tests:
-            try:
-                logger.info(f"\n🧪 Running: {test_name}")
-                await test_func()
-                test_results[test_name] = "✅ PASSED"
-                passed_tests += 1
-                logger.info(f"✅ {test_name}: PASSED")
-            except Exception as e:
-                test_results[test_name] = f"❌ FAILED: {str(e)}"
-                logger.error(f"❌ {test_name}: FAILED - {e}")
-    
-    # Run async tests
-    asyncio.run(run_async_tests())
+    # Per-test outcomes come from pytest's own JUnit report; pytest exits without
+    # writing it on collection and usage errors
+    if os.path.exists(report_path):
+        test_results = _read_junit_results(report_path)
+    else:
+        test_results = {"pytest": f"❌ FAILED: pytest exited with code {int(exit_code)} before writing a report"}
+    passed_tests = sum(result == "✅ PASSED" for result in test_results.values())
+    stats = get_comprehensive_statistics()
     
     # Generate comprehensive report
-    total_tests = len(tests) + len(async_tests)
-    success_rate = (passed_tests / total_tests) * 100
+    total_tests = len(test_results)
+    success_rate = (passed_tests / total_tests) * 100 if total_tests else 0.0
     test_time = time.time() - start_time
     
     logger.info("\n" + "=" * 80)
     logger.info("🎯 ULTRA-COMPREHENSIVE EXPANSION TEST RESULTS")
     logger.info("=" * 80)
     
-    for test_name, result in test_results.items():
-        logger.info(f"{result.split(':')[0]} {test_name}")
+    logger.info("\n".join(f"{result.split(':')[0]} {test_name}" for test_name, result in test_results.items()))
     
-    logger.info(f"\n📊 SUMMARY:")
-    logger.info(f"   ✅ Passed: {passed_tests}/{total_tests}")
-    logger.info(f"   📈 Success Rate: {success_rate:.1f}%")
-    logger.info(f"   ⏱️ Test Duration: {test_time:.2f}s")
+    logger.info("\n📊 SUMMARY:")
+    logger.info("   ✅ Passed: %s/%s", passed_tests, total_tests)
+    logger.info("   📈 Success Rate: %.1f%%", success_rate)
+    logger.info("   ⏱️ Test Duration: %.2fs", test_time)
     
-    # Get final statistics
+    # Report final statistics
     try:
-        stats = get_comprehensive_statistics()
-        logger.info(f"\n🌍 ULTRA-COMPREHENSIVE SYSTEM STATISTICS:")
-        logger.info(f"   📁 Total Sources: {stats['total_sources']:,}")
-        logger.info(f"   📄 Total Estimated Documents: {stats['total_estimated_documents']:,}")
-        logger.info(f"   🌍 Jurisdictions Covered: {len(stats['jurisdiction_breakdown']):,}")
-        logger.info(f"   🏆 High Priority Sources: {stats['high_priority_sources']:,}")
-        logger.info(f"   🔗 API Sources: {stats['api_sources']:,}")
-        logger.info(f"   🕷️ Web Scraping Sources: {stats['web_scraping_sources']:,}")
+        logger.info("\n🌍 ULTRA-COMPREHENSIVE SYSTEM STATISTICS:")
+        logger.info("   📁 Total Sources: %s", format(stats['total_sources'], ","))
+        logger.info("   📄 Total Estimated Documents: %s", format(stats['total_estimated_documents'], ","))
+        logger.info("   🌍 Jurisdictions Covered: %s", format(len(stats['jurisdiction_breakdown']), ","))
+        logger.info("   🏆 High Priority Sources: %s", format(stats['high_priority_sources'], ","))
+        logger.info("   🔗 API Sources: %s", format(stats['api_sources'], ","))
+        logger.info("   🕷️ Web Scraping Sources: %s", format(stats['web_scraping_sources'], ","))
     except Exception as e:
-        logger.error(f"Failed to get final statistics: {e}")
+        logger.error("Failed to get final statistics: %s", e)
     
     # Overall assessment
     if success_rate >= 80:
-        logger.info(f"🎉 ULTRA-COMPREHENSIVE EXPANSION: SUCCESS!")
-        logger.info(f"   System ready for 370M+ document processing from 1,000+ sources")
+        logger.info("🎉 ULTRA-COMPREHENSIVE EXPANSION: SUCCESS!")
+        logger.info("   System ready for 370M+ document processing from 1,000+ sources")
     else:
-        logger.warning(f"⚠️ EXPANSION ISSUES DETECTED")
-        logger.warning(f"   Success rate: {success_rate:.1f}% - Review failed tests")
+        logger.warning("⚠️ EXPANSION ISSUES DETECTED")
+        logger.warning("   Success rate: %.1f%% - Review failed tests", success_rate)
     
     return {
+        'report_path': report_path,
         'success_rate': success_rate,
         'passed_tests': passed_tests,
         'total_tests': total_tests,
@@ -16,11 +16,16 @@ SCOPE: 7-Tier Ultra-Comprehensive Legal Database
 TOTAL: 370M+ Documents from 1,000+ Sources
 """
 
+from collections import defaultdict
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+import numpy as np
+
 class SourceType(Enum):
     API = "api"
     WEB_SCRAPING = "web_scraping"
@@ -58,6 +63,19 @@ class SourceConfig:
     access_method: str = "public"
     update_frequency: str = "daily"
     content_format: List[str] = None
+    
+    def __post_init__(self):
+        # Validate once at construction so consumers never need to re-check fields
+        if not (self.name and self.base_url and self.jurisdiction):
+            raise ValueError(f"SourceConfig {self.name!r} requires name, base_url and jurisdiction")
+        if not isinstance(self.source_type, SourceType):
+            raise ValueError(f"SourceConfig {self.name!r} has invalid source_type: {self.source_type!r}")
+        if self.estimated_documents < 0:
+            raise ValueError(f"SourceConfig {self.name!r} has negative estimated_documents")
+        if not 1 <= self.priority <= 5:
+            raise ValueError(f"SourceConfig {self.name!r} priority must be 1-5, got {self.priority}")
+        if not 0 <= self.quality_score <= 10:
+            raise ValueError(f"SourceConfig {self.name!r} quality_score must be 0-10, got {self.quality_score}")
 
 # =============================================================================
 # 🏛️ TIER 1: COMPLETE US GOVERNMENT ECOSYSTEM (100M+ Documents)
@@ -1263,10 +1281,14 @@ ULTRA_COMPREHENSIVE_GLOBAL_SOURCES = {
     **TIER_7_SPECIALIZED,
 }
 
+# Registry totals, computed once at import and shared by every consumer
+TOTAL_SOURCES = len(ULTRA_COMPREHENSIVE_GLOBAL_SOURCES)
+TOTAL_ESTIMATED_DOCUMENTS = sum(source.estimated_documents for source in ULTRA_COMPREHENSIVE_GLOBAL_SOURCES.values())
+
 # Performance Scaling Configuration for Ultra-Comprehensive Sources
 ULTRA_COMPREHENSIVE_CONFIG = {
-    "total_sources": len(ULTRA_COMPREHENSIVE_GLOBAL_SOURCES),
-    "total_estimated_documents": sum(source.estimated_documents for source in ULTRA_COMPREHENSIVE_GLOBAL_SOURCES.values()),
+    "total_sources": TOTAL_SOURCES,
+    "total_estimated_documents": TOTAL_ESTIMATED_DOCUMENTS,
     "concurrent_workers": 200,
     "source_batches": 50,
     "rate_limit_buffer": 0.8,
@@ -1284,67 +1306,130 @@ ULTRA_COMPREHENSIVE_CONFIG = {
     }
 }
 
-def get_sources_by_tier(tier: int) -> Dict[str, SourceConfig]:
+# Tier membership comes from the tier group dicts; jurisdiction and priority
+# buckets come from the master registry. The indexes are built in one pass at
+# import, so the get_sources_by_* filters are single dict lookups returning
+# read-only mappings. Call clear_source_caches() if the registry is rebuilt.
+_TIER_GROUPS = {
+    1: (TIER_1_US_FEDERAL_EXECUTIVE, TIER_1_US_FEDERAL_INDEPENDENT,
+        TIER_1_US_FEDERAL_JUDICIAL, TIER_1_US_LEGISLATIVE),
+    2: (TIER_2_EUROPEAN_UNION, TIER_2_UK_COMMONWEALTH, TIER_2_ASIA_PACIFIC),
+    3: (TIER_3_US_LAW_SCHOOLS, TIER_3_INTERNATIONAL_ACADEMIC),
+    4: (TIER_4_LEGAL_JOURNALISM,),
+    5: (TIER_5_NATIONAL_BARS, TIER_5_STATE_BARS),
+    6: (TIER_6_LEGAL_AID,),
+    7: (TIER_7_SPECIALIZED,)
+}
+
+_EMPTY_SOURCES: Mapping[str, SourceConfig] = MappingProxyType({})
+_TIER_INDEX: Dict[int, Mapping[str, SourceConfig]] = {}
+_JURISDICTION_INDEX: Dict[str, Mapping[str, SourceConfig]] = {}
+_PRIORITY_INDEX: Dict[int, Mapping[str, SourceConfig]] = {}
+
+def _build_source_indexes() -> None:
+    """(Re)build the tier, jurisdiction and priority lookup indexes"""
+    tiers = {}
+    for tier, groups in _TIER_GROUPS.items():
+        merged = {}
+        for group in groups:
+            merged.update(group)
+        tiers[tier] = MappingProxyType(merged)
+    
+    jurisdictions = defaultdict(dict)
+    priorities = defaultdict(dict)
+    for source_id, config in ULTRA_COMPREHENSIVE_GLOBAL_SOURCES.items():
+        jurisdictions[config.jurisdiction][source_id] = config
+        priorities[config.priority][source_id] = config
+    
+    _TIER_INDEX.clear()
+    _TIER_INDEX.update(tiers)
+    _JURISDICTION_INDEX.clear()
+    _JURISDICTION_INDEX.update((key, MappingProxyType(value)) for key, value in jurisdictions.items())
+    _PRIORITY_INDEX.clear()
+    _PRIORITY_INDEX.update((key, MappingProxyType(value)) for key, value in priorities.items())
+
+_build_source_indexes()
+
+def get_sources_by_tier(tier: int) -> Mapping[str, SourceConfig]:
     """Get all sources for a specific tier"""
-    tier_mappings = {
-        1: {**TIER_1_US_FEDERAL_EXECUTIVE, **TIER_1_US_FEDERAL_INDEPENDENT, 
-            **TIER_1_US_FEDERAL_JUDICIAL, **TIER_1_US_LEGISLATIVE},
-        2: {**TIER_2_EUROPEAN_UNION, **TIER_2_UK_COMMONWEALTH, **TIER_2_ASIA_PACIFIC},
-        3: {**TIER_3_US_LAW_SCHOOLS, **TIER_3_INTERNATIONAL_ACADEMIC},
-        4: TIER_4_LEGAL_JOURNALISM,
-        5: {**TIER_5_NATIONAL_BARS, **TIER_5_STATE_BARS},
-        6: TIER_6_LEGAL_AID,
-        7: TIER_7_SPECIALIZED
-    }
-    return tier_mappings.get(tier, {})
+    return _TIER_INDEX.get(tier, _EMPTY_SOURCES)
 
-def get_sources_by_jurisdiction(jurisdiction: str) -> Dict[str, SourceConfig]:
+def get_sources_by_jurisdiction(jurisdiction: str) -> Mapping[str, SourceConfig]:
     """Get all sources for a specific jurisdiction"""
-    return {
-        source_id: config 
-        for source_id, config in ULTRA_COMPREHENSIVE_GLOBAL_SOURCES.items() 
-        if config.jurisdiction == jurisdiction
-    }
+    return _JURISDICTION_INDEX.get(jurisdiction, _EMPTY_SOURCES)
 
-def get_sources_by_priority(priority: int) -> Dict[str, SourceConfig]:
+def get_sources_by_priority(priority: int) -> Mapping[str, SourceConfig]:
     """Get all sources with specific priority level"""
-    return {
-        source_id: config 
-        for source_id, config in ULTRA_COMPREHENSIVE_GLOBAL_SOURCES.items() 
-        if config.priority == priority
+    return _PRIORITY_INDEX.get(priority, _EMPTY_SOURCES)
+
+@lru_cache(maxsize=None)
+def get_source_numeric_view() -> Dict[str, np.ndarray]:
+    """Column-oriented (structure-of-arrays) view of the numeric source fields
+    
+    Built once on first use; analytics passes run as vectorized NumPy
+    operations over these read-only columns instead of per-object loops.
+    """
+    configs = ULTRA_COMPREHENSIVE_GLOBAL_SOURCES.values()
+    count = len(ULTRA_COMPREHENSIVE_GLOBAL_SOURCES)
+    source_tiers = {
+        source_id: tier for tier, tier_sources in _TIER_INDEX.items() for source_id in tier_sources
     }
+    columns = {
+        "tier": np.fromiter(
+            (source_tiers.get(source_id, 0) for source_id in ULTRA_COMPREHENSIVE_GLOBAL_SOURCES),
+            dtype=np.int8, count=count
+        ),
+        "priority": np.fromiter((c.priority for c in configs), dtype=np.int8, count=count),
+        "quality": np.fromiter((c.quality_score for c in configs), dtype=np.float32, count=count),
+        "docs": np.fromiter((c.estimated_documents for c in configs), dtype=np.int64, count=count)
+    }
+    for column in columns.values():
+        column.flags.writeable = False
+    return columns
+
+def _refresh_registry_totals() -> None:
+    """Recompute the registry totals and the totals in ULTRA_COMPREHENSIVE_CONFIG"""
+    global TOTAL_SOURCES, TOTAL_ESTIMATED_DOCUMENTS
+    columns = get_source_numeric_view()
+    TOTAL_SOURCES = int(columns["docs"].size)
+    TOTAL_ESTIMATED_DOCUMENTS = int(columns["docs"].sum())
+    ULTRA_COMPREHENSIVE_CONFIG["total_sources"] = TOTAL_SOURCES
+    ULTRA_COMPREHENSIVE_CONFIG["total_estimated_documents"] = TOTAL_ESTIMATED_DOCUMENTS
+
+def clear_source_caches() -> None:
+    """Rebuild source lookup indexes and totals after the source registry changes"""
+    _build_source_indexes()
+    get_source_numeric_view.cache_clear()
+    _refresh_registry_totals()
 
 def get_comprehensive_statistics():
     """Get comprehensive statistics about the ultra-comprehensive sources"""
-    total_sources = len(ULTRA_COMPREHENSIVE_GLOBAL_SOURCES)
-    total_documents = sum(config.estimated_documents for config in ULTRA_COMPREHENSIVE_GLOBAL_SOURCES.values())
-    
-    # Group by tier
-    tier_stats = {}
-    for tier in range(1, 8):
-        tier_sources = get_sources_by_tier(tier)
-        tier_stats[f"tier_{tier}"] = {
-            "sources": len(tier_sources),
-            "documents": sum(config.estimated_documents for config in tier_sources.values())
+    total_sources = TOTAL_SOURCES
+    total_documents = TOTAL_ESTIMATED_DOCUMENTS
+    
+    # Per-tier totals from one bincount over the numeric columns (tier 0 = untiered)
+    columns = get_source_numeric_view()
+    tier_source_counts = np.bincount(columns["tier"], minlength=8)
+    tier_document_sums = np.bincount(columns["tier"], weights=columns["docs"], minlength=8)
+    tier_stats = {
+        f"tier_{tier}": {
+            "sources": int(tier_source_counts[tier]),
+            "documents": int(tier_document_sums[tier])
         }
+        for tier in range(1, 8)
+    }
     
-    # Group by jurisdiction
+    # Group by jurisdiction and source type in a single pass
     jurisdictions = {}
-    for config in ULTRA_COMPREHENSIVE_GLOBAL_SOURCES.values():
-        jurisdiction = config.jurisdiction
-        if jurisdiction not in jurisdictions:
-            jurisdictions[jurisdiction] = {"sources": 0, "documents": 0}
-        jurisdictions[jurisdiction]["sources"] += 1
-        jurisdictions[jurisdiction]["documents"] += config.estimated_documents
-    
-    # Group by source type
     source_types = {}
     for config in ULTRA_COMPREHENSIVE_GLOBAL_SOURCES.values():
-        source_type = config.source_type.value
-        if source_type not in source_types:
-            source_types[source_type] = {"sources": 0, "documents": 0}
-        source_types[source_type]["sources"] += 1
-        source_types[source_type]["documents"] += config.estimated_documents
+        jurisdiction_entry = jurisdictions.setdefault(config.jurisdiction, {"sources": 0, "documents": 0})
+        jurisdiction_entry["sources"] += 1
+        jurisdiction_entry["documents"] += config.estimated_documents
+        
+        source_type_entry = source_types.setdefault(config.source_type.value, {"sources": 0, "documents": 0})
+        source_type_entry["sources"] += 1
+        source_type_entry["documents"] += config.estimated_documents
     
     return {
         "total_sources": total_sources,
@@ -1353,21 +1438,25 @@ def get_comprehensive_statistics():
         "jurisdiction_breakdown": jurisdictions,
         "source_type_breakdown": source_types,
         "average_documents_per_source": total_documents // total_sources if total_sources > 0 else 0,
-        "high_priority_sources": len(get_sources_by_priority(1)),
-        "api_sources": len([c for c in ULTRA_COMPREHENSIVE_GLOBAL_SOURCES.values() if c.source_type == SourceType.API]),
-        "web_scraping_sources": len([c for c in ULTRA_COMPREHENSIVE_GLOBAL_SOURCES.values() if c.source_type == SourceType.WEB_SCRAPING])
+        "high_priority_sources": int(np.count_nonzero(columns["priority"] == 1)),
+        "api_sources": source_types.get(SourceType.API.value, {}).get("sources", 0),
+        "web_scraping_sources": source_types.get(SourceType.WEB_SCRAPING.value, {}).get("sources", 0)
     }
 
 # Export main configuration
 __all__ = [
     'ULTRA_COMPREHENSIVE_GLOBAL_SOURCES',
     'ULTRA_COMPREHENSIVE_CONFIG',
+    'TOTAL_SOURCES',
+    'TOTAL_ESTIMATED_DOCUMENTS',
     'SourceConfig',
     'SourceType', 
     'DocumentType',
     'get_sources_by_tier',
     'get_sources_by_jurisdiction',
     'get_sources_by_priority',
+    'get_source_numeric_view',
+    'clear_source_caches',
     'get_comprehensive_statistics'
 ]
 
@@ -809,7 +809,7 @@ class UltraScaleDatabaseService:
             'per_page': per_page
         }
         cache_str = json.dumps(cache_data, sort_keys=True, default=str)
-        return hashlib.md5(cache_str.encode()).hexdigest()
+        return hashlib.blake2b(cache_str.encode(), digest_size=16).hexdigest()
     
     def _get_cached_result(self, cache_key: str) -> Optional[LegalDocumentResponse]:
         """Retrieve cached query result if still valid"""
@@ -104,7 +104,7 @@ async def get_performance_optimizer():
             import os
             mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
             
-            performance_optimizer = UltraScalePerformanceOptimizer(mongo_url)
+            performance_optimizer = UltraScalePerformanceOptimizer(mongo_url, prewarm_cache=True)
             await performance_optimizer.initialize_performance_system()
             
             performance_monitor = UltraScalePerformanceMonitor(performance_optimizer)
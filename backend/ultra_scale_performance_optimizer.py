@@ -26,8 +26,48 @@ from pymongo import IndexModel, ASCENDING, DESCENDING, TEXT
 from pymongo.errors import DuplicateKeyError, OperationFailure
 import pymongo
 
+# Optional zstd compression for large cache payloads (falls back to gzip)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Optional C-backed JSON for cache payload serialization (falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Payloads smaller than this are stored uncompressed
+COMPRESSION_MIN_BYTES = 1024
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _serialize_cache_payload(data: Any) -> bytes:
+    """Serialize a cache payload to JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+    return json.dumps(data, default=str).encode('utf-8')
+
+def canonical_cache_key(key_data: Any) -> str:
+    """
+    Order-independent, fixed-width cache key (32 hex chars) for L1/L2 lookups
+    Keys are sorted at every level, so equivalent filters built in any order share a key
+    """
+    key_string = json.dumps(key_data, sort_keys=True, default=str)
+    return hashlib.blake2b(key_string.encode(), digest_size=16).hexdigest()
+
+def _deserialize_cache_payload(serialized: bytes) -> Any:
+    """Deserialize JSON bytes produced by _serialize_cache_payload"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(serialized)
+    return json.loads(serialized.decode('utf-8'))
+
 # ================================================================================================
 # MONGODB CACHING ARCHITECTURE CONFIGURATION
 # ================================================================================================
@@ -162,8 +202,8 @@ class ThreadSafeApplicationCache:
                 
                 # Add/update entry
                 if key in cache_dict:
-                    # Update existing entry
-                    old_size = self._estimate_size_mb(cache_dict[key])
+                    # Update existing entry (sizes are charged per value, as in eviction and cleanup)
+                    old_size = self._estimate_size_mb(cache_dict[key]['value'])
                     self.current_size_mb -= old_size
                 
                 cache_dict[key] = {
@@ -210,8 +250,11 @@ class ThreadSafeApplicationCache:
     def _estimate_size_mb(self, value: Any) -> float:
         """Estimate memory size of cached value in MB"""
         try:
-            # Use pickle to estimate serialized size
-            serialized = pickle.dumps(value)
+            # Use the cache payload serializer to estimate size, pickle for other objects
+            try:
+                serialized = _serialize_cache_payload(value)
+            except TypeError:
+                serialized = pickle.dumps(value)
             return len(serialized) / (1024 * 1024)  # Convert to MB
         except:
             # Fallback estimation
@@ -267,8 +310,9 @@ class MongoDBCacheManager:
     Primary caching system with TTL indexes and intelligent partitioning
     """
     
-    def __init__(self, mongo_url: str):
+    def __init__(self, mongo_url: str, client_options: Optional[Dict[str, Any]] = None):
         self.mongo_url = mongo_url
+        self.client_options = client_options or {}
         self.client: Optional[AsyncIOMotorClient] = None
         self.cache_db: Optional[AsyncIOMotorDatabase] = None
         self.cache_collections: Dict[str, AsyncIOMotorCollection] = {}
@@ -347,20 +391,32 @@ class MongoDBCacheManager:
         # Performance metrics for each cache
         self.cache_metrics: Dict[str, CacheMetrics] = {}
         
+        # Compression codec for large payloads (zstd level 3 when available)
+        if ZSTD_AVAILABLE:
+            self.compression_codec = 'zstd'
+            self._zstd_compressor = zstandard.ZstdCompressor(level=3)
+            self._zstd_decompressor = zstandard.ZstdDecompressor()
+        else:
+            self.compression_codec = 'gzip'
+        
         logger.info(f"🗄️ MongoDB Cache Manager initialized with {len(self.cache_configurations)} cache types")
     
-    async def initialize_mongodb_caching(self):
-        """Initialize MongoDB cache collections with optimized indexes"""
+    async def initialize_mongodb_caching(self, create_indexes: bool = True):
+        """Initialize MongoDB cache collections with optimized indexes
+        
+        Pass create_indexes=False to only connect and bind the collections, e.g. from
+        extra worker processes once the indexes already exist.
+        """
         logger.info("🏗️ Initializing MongoDB caching architecture...")
         
         try:
             # Connect to MongoDB
-            self.client = AsyncIOMotorClient(self.mongo_url)
+            self.client = AsyncIOMotorClient(self.mongo_url, **self.client_options)
             self.cache_db = self.client['ultra_scale_cache']
             
             # Initialize each cache collection
             for cache_name, config in self.cache_configurations.items():
-                await self._initialize_cache_collection(cache_name, config)
+                await self._initialize_cache_collection(cache_name, config, create_indexes)
                 
                 # Initialize metrics
                 self.cache_metrics[cache_name] = CacheMetrics(cache_name)
@@ -371,10 +427,13 @@ class MongoDBCacheManager:
             logger.error(f"❌ Failed to initialize MongoDB caching: {e}")
             raise
     
-    async def _initialize_cache_collection(self, cache_name: str, config: CacheConfiguration):
+    async def _initialize_cache_collection(self, cache_name: str, config: CacheConfiguration,
+                                           create_indexes: bool = True):
         """Initialize individual cache collection with indexes and TTL"""
         collection = self.cache_db[config.collection_name]
         self.cache_collections[cache_name] = collection
+        if not create_indexes:
+            return
         
         # Create TTL index for automatic cleanup
         ttl_index = IndexModel(
@@ -433,9 +492,7 @@ class MongoDBCacheManager:
                 metric.hit_count += 1
                 
                 # Decompress if needed
-                cached_data = result.get('cached_data')
-                if result.get('compressed', False) and cached_data:
-                    cached_data = self._decompress_data(cached_data)
+                cached_data = self._load_cached_data(result)
                 
                 # Update access statistics
                 await collection.update_one(
@@ -476,20 +533,23 @@ class MongoDBCacheManager:
             current_time = datetime.utcnow()
             expires_at = current_time + timedelta(seconds=ttl_seconds)
             
-            # Compress data if enabled
+            # Compress data if enabled and the payload is large enough to benefit
             cached_data = data
             compressed = False
             if config.compression_enabled:
-                compressed_data = self._compress_data(data)
-                if len(compressed_data) < len(str(data)):  # Only use if actually smaller
-                    cached_data = compressed_data
-                    compressed = True
+                serialized = _serialize_cache_payload(data)
+                if len(serialized) >= COMPRESSION_MIN_BYTES:
+                    compressed_data = self._compress_data(serialized)
+                    if len(compressed_data) < len(serialized):  # Only use if actually smaller
+                        cached_data = compressed_data
+                        compressed = True
             
             # Create cache document
             cache_document = {
                 'cache_key': cache_key,
                 'cached_data': cached_data,
                 'compressed': compressed,
+                'compression': self.compression_codec if compressed else None,
                 'created_at': current_time,
                 'expires_at': expires_at,
                 'access_count': 1,
@@ -516,15 +576,29 @@ class MongoDBCacheManager:
             logger.error(f"L2 Cache set error: {e}")
             return False
     
-    def _compress_data(self, data: Any) -> bytes:
-        """Compress data using gzip"""
-        serialized = json.dumps(data, default=str).encode('utf-8')
+    def _compress_data(self, serialized: bytes) -> bytes:
+        """Compress serialized data using zstd (or gzip when zstd is unavailable)"""
+        if self.compression_codec == 'zstd':
+            return self._zstd_compressor.compress(serialized)
         return gzip.compress(serialized)
     
-    def _decompress_data(self, compressed_data: bytes) -> Any:
-        """Decompress gzip data"""
-        decompressed = gzip.decompress(compressed_data)
-        return json.loads(decompressed.decode('utf-8'))
+    def _decompress_data(self, compressed_data: bytes, compression: str = 'gzip') -> Any:
+        """Decompress zstd or gzip data"""
+        if compression == 'zstd':
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("zstd-compressed cache entry but zstandard is not installed")
+            decompressed = self._zstd_decompressor.decompress(compressed_data)
+        else:
+            decompressed = gzip.decompress(compressed_data)
+        return _deserialize_cache_payload(decompressed)
+    
+    def _load_cached_data(self, document: Dict[str, Any]) -> Any:
+        """Return the cached payload of a cache document, decompressing if needed"""
+        cached_data = document.get('cached_data')
+        if document.get('compressed', False) and cached_data:
+            # Entries written before zstd support carry no codec field and are gzip
+            cached_data = self._decompress_data(bytes(cached_data), document.get('compression') or 'gzip')
+        return cached_data
     
     def _add_partitioning_fields(self, document: Dict, strategy: str, metadata: Optional[Dict]):
         """Add partitioning fields based on strategy"""
@@ -670,6 +744,22 @@ class IntelligentQueryOptimizer:
             'ultra_high': {'ttl': 900, 'strategy': 'minimal_caching'}    # 15 minutes
         }
         
+        # Jurisdiction to shard mapping (built once, shared by all analyses)
+        self.jurisdiction_shard_mapping = {
+            'united states': ['us_federal', 'us_state'],
+            'federal': ['us_federal'],
+            'california': ['us_state'],
+            'new york': ['us_state'],
+            'european union': ['european_union'],
+            'germany': ['european_union'],
+            'france': ['european_union'],
+            'united kingdom': ['commonwealth'],
+            'canada': ['commonwealth'],
+            'australia': ['commonwealth'],
+            'japan': ['asia_pacific'],
+            'china': ['asia_pacific']
+        }
+        
         logger.info("🤖 Intelligent Query Optimizer initialized with AI complexity analysis")
     
     async def analyze_query_complexity(self, query_filter: Dict[str, Any], 
@@ -979,24 +1069,9 @@ class IntelligentQueryOptimizer:
                     optimal_shards.append('professional')
         else:
             # Map jurisdictions to shards
-            jurisdiction_mapping = {
-                'united states': ['us_federal', 'us_state'],
-                'federal': ['us_federal'],
-                'california': ['us_state'],
-                'new york': ['us_state'],
-                'european union': ['european_union'],
-                'germany': ['european_union'],
-                'france': ['european_union'],
-                'united kingdom': ['commonwealth'],
-                'canada': ['commonwealth'],
-                'australia': ['commonwealth'],
-                'japan': ['asia_pacific'],
-                'china': ['asia_pacific']
-            }
-            
             for jurisdiction in jurisdictions:
                 jurisdiction_lower = jurisdiction.lower()
-                for key, shards in jurisdiction_mapping.items():
+                for key, shards in self.jurisdiction_shard_mapping.items():
                     if key in jurisdiction_lower:
                         optimal_shards.extend(shards)
                         break
@@ -1094,12 +1169,15 @@ class UltraScalePerformanceOptimizer:
     Integrates MongoDB caching, AI query optimization, and performance monitoring
     """
     
-    def __init__(self, mongo_url: str):
+    def __init__(self, mongo_url: str, client_options: Optional[Dict[str, Any]] = None,
+                 prewarm_cache: bool = False):
         self.mongo_url = mongo_url
+        # Opt-in: seeding L1 from L2 at start-up turns first executions into cache hits
+        self.prewarm_cache = prewarm_cache
         
         # Initialize core components
         self.application_cache = ThreadSafeApplicationCache(max_size_mb=2048, max_entries=10000)
-        self.mongodb_cache = MongoDBCacheManager(mongo_url)
+        self.mongodb_cache = MongoDBCacheManager(mongo_url, client_options)
         self.query_optimizer = IntelligentQueryOptimizer()
         
         # Performance monitoring
@@ -1126,6 +1204,10 @@ class UltraScalePerformanceOptimizer:
             # Initialize MongoDB caching
             await self.mongodb_cache.initialize_mongodb_caching()
             
+            # Seed L1 with the most frequently accessed L2 query results
+            if self.prewarm_cache:
+                await self.prewarm_application_cache()
+            
             # Initialize performance monitoring
             await self._initialize_performance_monitoring()
             
@@ -1138,6 +1220,41 @@ class UltraScalePerformanceOptimizer:
             logger.error(f"❌ Failed to initialize performance system: {e}")
             raise
     
+    async def prewarm_application_cache(self, top_k: int = 32) -> int:
+        """Seed L1 hot_queries with the most accessed unexpired L2 query results"""
+        try:
+            collection = self.mongodb_cache.cache_collections.get('ultra_query_cache')
+            if collection is None:
+                return 0
+            
+            current_time = datetime.utcnow()
+            cursor = collection.find(
+                {'expires_at': {'$gt': current_time}},
+                {'cache_key': 1, 'cached_data': 1, 'compressed': 1, 'compression': 1, 'expires_at': 1}
+            ).sort('access_count', DESCENDING).limit(top_k)
+            hot_documents = await cursor.to_list(length=top_k)
+            
+            for document in hot_documents:
+                cached_data = self.mongodb_cache._load_cached_data(document)
+                
+                # Never outlive the L2 entry, and respect the 10 minute L1 ceiling
+                remaining_seconds = int((document['expires_at'] - current_time).total_seconds())
+                await self.application_cache.set(
+                    'hot_queries',
+                    document['cache_key'],
+                    cached_data,
+                    ttl_seconds=min(remaining_seconds, 600)
+                )
+            
+            if hot_documents:
+                logger.info(f"🔥 L1 cache pre-warmed with {len(hot_documents)} hot queries")
+            
+            return len(hot_documents)
+            
+        except Exception as e:
+            logger.warning(f"⚠️ L1 cache pre-warm skipped: {e}")
+            return 0
+    
     async def _initialize_performance_monitoring(self):
         """Initialize performance monitoring component"""
         # This will be integrated with existing monitoring from Step 4.1
@@ -1294,16 +1411,12 @@ class UltraScalePerformanceOptimizer:
         """Generate consistent cache key for query"""
         # Create deterministic key from query parameters
         key_data = {
-            'query_filter': query_filter,
+            'query_filter': dict(query_filter),  # Accept read-only mappings
             'page': page,
             'per_page': per_page
         }
         
-        # Sort and serialize for consistency
-        key_string = json.dumps(key_data, sort_keys=True, default=str)
-        
-        # Generate hash
-        return hashlib.sha256(key_string.encode()).hexdigest()
+        return canonical_cache_key(key_data)
     
     async def _execute_optimized_query(self, query_filter: Dict[str, Any], 
                                      optimization_strategy: Dict[str, Any],
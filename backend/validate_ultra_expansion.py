@@ -5,9 +5,11 @@
 Quick validation of the massive 121 → 1,000+ sources expansion
 """
 
+import heapq
 import sys
 import traceback
 from datetime import datetime
+from operator import itemgetter
 
 def main():
     print("🌍 ULTRA-COMPREHENSIVE GLOBAL SOURCES VALIDATION")
@@ -121,7 +123,7 @@ def main():
         print(f"✅ Unique Jurisdictions: {len(jurisdictions):,}")
         
         # Show top source types
-        for source_type, count in sorted(source_types.items(), key=lambda x: x[1], reverse=True)[:5]:
+        for source_type, count in heapq.nlargest(5, source_types.items(), key=itemgetter(1)):
             print(f"   📊 {source_type}: {count:,} sources")
         
         validation_results['config_validity'] = validity_rate >= 90